@@ -12,6 +12,20 @@ setuptools.setup(
     install_requires=[
         "requests"
     ],
+    extras_require={
+        "async": [
+            "aiohttp"
+        ],
+        "httpx": [
+            "httpx[http2]"
+        ],
+        "orjson": [
+            "orjson"
+        ],
+        "ujson": [
+            "ujson"
+        ]
+    },
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/n-vlahovic/couchdb3",
@@ -1,14 +1,26 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-from datetime import datetime, timezone
+import concurrent.futures
+import functools
+import gzip
 import requests
-import requests.auth
-from typing import Dict, List, Optional, Union
+import requests.adapters
+import urllib3.util
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+from urllib import parse
+import weakref
 
 from . import exceptions
 from . import utils
 
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
 
 __all__ = [
     "Base",
@@ -16,10 +28,98 @@ __all__ = [
 ]
 
 
+def _get_adapter(
+        pool_size: int,
+        max_retries: int,
+        backoff_factor: float
+) -> requests.adapters.HTTPAdapter:
+    """
+    Get the transport adapter of a new `requests` session. Its pooled connections are released once the session is
+    closed, while instances derived from the one owning the session (e.g. `Server.get`) reuse its warm keep-alive
+    connections. Nagle's algorithm is already disabled by `urllib3`'s default socket options.
+
+    Parameters
+    ----------
+    pool_size : int
+        The number of pooled keep-alive connections per host.
+    max_retries : int
+        The number of times idempotent requests failing with a transient error are retried.
+    backoff_factor : float
+        The exponential backoff factor between retries.
+
+    Returns
+    -------
+    requests.adapters.HTTPAdapter
+    """
+    return requests.adapters.HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        pool_block=False,
+        max_retries=urllib3.util.Retry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=utils.RETRY_STATUS_CODES,
+            allowed_methods=utils.RETRY_METHODS,
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+    )
+
+
+def _is_read_only(
+        method: str,
+        resource: Optional[str]
+) -> bool:
+    """
+    Whether a request only reads data, i.e. is a `GET` or `HEAD` request or a `POST` request to a view or to one of
+    `couchdb3.utils.READ_ONLY_POST_ENDPOINTS`.
+    """
+    if method in ("GET", "HEAD"):
+        return True
+    if method != "POST" or not resource:
+        return False
+    path, _, endpoint = resource.rpartition("/")
+    return endpoint in utils.READ_ONLY_POST_ENDPOINTS or path.endswith("_view")
+
+
 class Base(object):
     """
     Abstract base class
     """
+    __slots__ = (
+        "scheme",
+        "host",
+        "port",
+        "_url_prefix",
+        "_root",
+        "_url",
+        "session",
+        "transport",
+        "disable_ssl_verification",
+        "_user",
+        "_password",
+        "_basic",
+        "_basic_header",
+        "_auth_expiry",
+        "_auth_lock",
+        "auth_method",
+        "timeout",
+        "connect_timeout",
+        "head_cache_ttl",
+        "compress_request",
+        "etag_cache_size",
+        "pool_size",
+        "_head_cache",
+        "_etag_cache",
+        "_etag_generation",
+        "_etag_lock",
+        "_finalizer",
+        "_thread_pool",
+        "_thread_pool_lock",
+        "_owns_session",
+        "_send_settings",
+        "__weakref__",
+    )
 
     def __init__(
             self,
@@ -32,6 +132,14 @@ class Base(object):
             auth_method: str = None,
             timeout: int = utils.DEFAULT_TIMEOUT,
             session: requests.Session = None,
+            pool_size: int = utils.DEFAULT_POOL_SIZE,
+            connect_timeout: int = utils.DEFAULT_CONNECT_TIMEOUT,
+            head_cache_ttl: float = utils.DEFAULT_HEAD_CACHE_TTL,
+            transport: str = utils.DEFAULT_TRANSPORT,
+            max_retries: int = utils.DEFAULT_MAX_RETRIES,
+            backoff_factor: float = utils.DEFAULT_BACKOFF_FACTOR,
+            compress_request: bool = False,
+            etag_cache_size: int = utils.ETAG_CACHE_MAX_SIZE,
     ) -> None:
         """
 
@@ -56,50 +164,138 @@ class Base(object):
         timeout : int
             The default timeout for requests. Default c.f. `couchdb3.utils.DEFAULT_TIMEOUT`.
         session: requests.Session
-            A specific session to use. Optional - if not provided, a new session will be initialized.
+            A specific session to use, either a `requests.Session` or an `httpx.Client`. Optional - if not provided, a
+            new session will be initialized. Sessions provided by the caller are not closed by the instance.
+        pool_size : int
+            The number of pooled keep-alive connections per host of a new session. Ignored if `session` is provided.
+            Default c.f. `couchdb3.utils.DEFAULT_POOL_SIZE`.
+        connect_timeout : int
+            The timeout for establishing a connection, kept apart from the (read) `timeout` so that unreachable hosts
+            fail fast. Default c.f. `couchdb3.utils.DEFAULT_CONNECT_TIMEOUT`.
+        head_cache_ttl : float
+            The number of seconds the outcome of existence checks (`bool(...)`, `in` and `check`) is reused for, so
+            that a check directly followed by the actual request costs a single round-trip. Mutating requests sent by
+            the instance clear the cache, whereas changes made via other instances or clients go unnoticed until the
+            outcome expires. `0` disables it. Default c.f. `couchdb3.utils.DEFAULT_HEAD_CACHE_TTL`.
+        transport : str
+            The HTTP client of a new session. Choices are `requests` or `httpx` - the latter multiplexes concurrent
+            requests over HTTP/2 connections and requires the `httpx` extra. Ignored if `session` is provided, the
+            transport is then inferred from the session's type. Default c.f. `couchdb3.utils.DEFAULT_TRANSPORT`.
+        max_retries : int
+            The number of times idempotent requests failing with a transient error (c.f.
+            `couchdb3.utils.RETRY_STATUS_CODES`) are retried on the pooled connections of a new `requests` session -
+            new `httpx` sessions only retry failed connection attempts. `0` disables retries. Default c.f.
+            `couchdb3.utils.DEFAULT_MAX_RETRIES`.
+        backoff_factor : float
+            The exponential backoff factor between retries - a `Retry-After` header sent by the server takes
+            precedence. Default c.f. `couchdb3.utils.DEFAULT_BACKOFF_FACTOR`.
+        compress_request : bool
+            Whether to gzip request bodies larger than `couchdb3.utils.COMPRESSION_THRESHOLD` bytes. Only enable it if
+            the server (or any proxy in front of it) decodes compressed requests. Default `False`.
+        etag_cache_size : int
+            The maximal number of response bodies kept for conditional `GET` requests (c.f.
+            `couchdb3.base.Base._get_content`), the least recently used ones being evicted first. `0` disables keeping
+            bodies. Default c.f. `couchdb3.utils.ETAG_CACHE_MAX_SIZE`.
         """
         auth_method = auth_method or utils.DEFAULT_AUTH_METHOD
         if utils.validate_auth_method(auth_method=auth_method) is False:
             raise exceptions.AuthenticationMethodError(
                 "Invalid authentication method. Possible values are \"basic\" and \"cookie\"."
             )
-        _ = utils.extract_url_data(url=url)
-        user = user or _["user"]
-        password = password or _["password"]
-        self.scheme = _["scheme"]
-        self.host = _["host"]
-        self.port = port or _["port"]
+        if session is not None:
+            transport = "requests" if isinstance(session, requests.Session) else "httpx"
+        if utils.validate_transport(transport=transport) is False:
+            raise exceptions.TransportMethodError(
+                "Invalid transport. Possible values are \"httpx\" and \"requests\"."
+            )
+        if transport == "httpx" and httpx is None:
+            raise ImportError("The `httpx` transport requires the `httpx` package, e.g. `pip install couchdb3[httpx]`.")
+        _ = parse.urlsplit(url if "://" in url else f"http://{url}")
+        user = user or _.username
+        password = password or _.password
+        self.scheme = _.scheme or "http"
+        self.host = f"[{_.hostname}]" if ":" in (_.hostname or "") else _.hostname
+        self.port = port or _.port
+        self._url_prefix = f"{self.scheme}://{self.host}"
+        if self.port:
+            self._url_prefix += f":{self.port}"
         self.root = None
-        self.session = session or requests.Session()
-        self.session.verify = disable_ssl_verification is False
+        owns_session = session is None
+        if owns_session and transport == "httpx":
+            # Like `requests` (`pool_block=False`), bursts exceeding the keep-alive pool open extra connections
+            # instead of waiting for a pooled one - with HTTP/2 most requests are multiplexed over the pooled ones.
+            # `httpx` has no status based retries - its transport only retries failed connection attempts.
+            session = httpx.Client(
+                transport=httpx.HTTPTransport(
+                    http2=True,
+                    verify=disable_ssl_verification is False,
+                    limits=httpx.Limits(max_connections=2 * pool_size, max_keepalive_connections=pool_size),
+                    retries=max_retries
+                )
+            )
+        elif owns_session:
+            session = requests.Session()
+            adapter = _get_adapter(pool_size=pool_size, max_retries=max_retries, backoff_factor=backoff_factor)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        self.session = session
+        self.transport = transport
+        self.disable_ssl_verification = disable_ssl_verification
         # Changing the default headers
         self.session.headers.update({
             "Accept": "application/json",
             "Content-type": "application/json"
         })
+        if transport == "requests":
+            # `httpx.Client` verifies TLS certificates per connection pool (c.f. above) and HTTP/2 forbids
+            # connection-specific headers.
+            self.session.verify = disable_ssl_verification is False
+            self.session.headers["Connection"] = "keep-alive"
         self._user = user
         self._password = password
-        self._auth = requests.auth.HTTPBasicAuth(user, password) if user and password else None
+        self._basic = utils.basic_auth(user=user, password=password)
+        self._basic_header = f"Basic {self._basic}" if user and password else None
+        self._auth_expiry = 0.0
+        self._auth_lock = threading.Lock()
         self.auth_method = auth_method
         self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.head_cache_ttl = head_cache_ttl
+        self.compress_request = compress_request
+        self.etag_cache_size = etag_cache_size
+        self.pool_size = pool_size
+        self._head_cache: Dict[str, Tuple[float, bool]] = {}
+        self._etag_cache: Dict[Tuple[Optional[str], str], Tuple[str, bytes]] = {}
+        self._etag_generation = 0
+        # Kept bodies are also evicted by the thread pool's and the change feed's threads.
+        self._etag_lock = threading.Lock()
+        self._thread_pool: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._thread_pool_lock = threading.Lock()
+        self._owns_session = owns_session
+        self._send_settings: Optional[Dict] = None
+        # Registered via `weakref.finalize` so that it neither references nor resurrects the instance. Instances
+        # derived from this one (e.g. `Server.get`) may still share the session upon garbage collection, hence only
+        # `requests` sessions are closed then - they merely open new connections afterwards, whereas closed `httpx`
+        # sessions refuse further requests. The thread pool's idle workers exit once the pool is garbage collected.
+        self._finalizer = weakref.finalize(self, session.close) if owns_session and transport == "requests" else None
 
     def __bool__(self) -> bool:
         """
-        Checks if the server/database exists.
+        Checks if the server/database exists. The outcome is reused for `head_cache_ttl` seconds unless the instance
+        sends a mutating request - deleting the database via another instance (e.g. `Server.delete`) is hence noticed
+        once the cached outcome expires.
 
         Returns
         -------
         bool: A boolean indicating whether the server/database exists.
         """
-        try:
-            self._head()
-            return True
-        except exceptions.CouchDBError:
-            return False
+        return self._head_cached()
 
     def __contains__(self, resource: str) -> bool:
         """
-        Checks if the server/database contains the given resource.
+        Checks if the server/database contains the given resource. The outcome is reused for `head_cache_ttl` seconds
+        unless the instance sends a mutating request - changes made via other instances or clients are hence noticed
+        once the cached outcome expires.
 
         Parameters
         ----------
@@ -110,21 +306,7 @@ class Base(object):
         -------
             bool: A boolean value indicating whether the server/database contains the given resource.
         """
-        try:
-            self._head(resource=resource)
-            return True
-        except exceptions.CouchDBError:
-            return False
-
-    def __del__(self) -> None:
-        """
-        Close the session on delete.
-
-        Returns
-        -------
-        None
-        """
-        self.session.close()
+        return self._head_cached(resource=resource)
 
     def __enter__(self):
         """
@@ -138,13 +320,21 @@ class Base(object):
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         """
-        Method ran after running `with ... as ...` statements.
+        Method ran after running `with ... as ...` statements. Closes the session owned by the instance, which also
+        applies to the instances derived from it (e.g. `Server.get`) - closed `httpx` sessions refuse further requests.
 
         Returns
         -------
         None
         """
-        self.session.close()
+        if self._finalizer is not None:
+            self._finalizer()
+        elif self._owns_session:
+            self.session.close()
+        # Pending tasks are still run, and a new thread pool is started if the instance is used again.
+        thread_pool, self._thread_pool = self._thread_pool, None
+        if thread_pool is not None:
+            thread_pool.shutdown(wait=False)
 
     def __repr__(self) -> str:
         """
@@ -158,7 +348,39 @@ class Base(object):
 
     @property
     def basic(self) -> str:
-        return utils.basic_auth(user=self._user, password=self._password)
+        return self._basic
+
+    @property
+    def _executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        """
+
+        Returns
+        -------
+        concurrent.futures.ThreadPoolExecutor: The instance's thread pool of `pool_size` workers - started upon first
+        use.
+        """
+        thread_pool = self._thread_pool
+        if thread_pool is None:
+            with self._thread_pool_lock:
+                if self._thread_pool is None:
+                    self._thread_pool = concurrent.futures.ThreadPoolExecutor(max_workers=self.pool_size)
+                thread_pool = self._thread_pool
+        return thread_pool
+
+    @property
+    def root(self) -> Optional[str]:
+        """
+
+        Returns
+        -------
+        Optional[str]: The instance's root relative to the server's URL, e.g. `"dbname"`.
+        """
+        return self._root
+
+    @root.setter
+    def root(self, root: Optional[str]) -> None:
+        self._root = root
+        self._url = f"{self._url_prefix}/{root}" if root else self._url_prefix
 
     @property
     def url(self) -> str:
@@ -166,22 +388,18 @@ class Base(object):
 
         Returns
         -------
-        str: The instance's url parsed using it's scheme, root and port.
+        str: The instance's url parsed using it's scheme, root and port - computed once whenever the root is set.
         """
-        url = f"{self.scheme}://{self.host}"
-        if self.port:
-            url += f":{self.port}"
-        if self.root:
-            url += f"/{self.root}"
-        return url
+        return self._url
 
     def _request(
             self,
+            resource: str = None,
             *,
             method: str,
-            resource: str = None,
-            body: Union[Dict, List] = None,
+            body: Union[Dict, List, bytes] = None,
             query_kwargs: Dict = None,
+            query: str = None,
             auth_method: str = None,
             root: str = None,
             timeout: int = None,
@@ -192,20 +410,25 @@ class Base(object):
 
         Parameters
         ----------
-        method : str
-            The request method.
         resource : str
             The resource to fetch (relative to the host). Default `None`.
-        body : Union[Dict, List]
-            The request's body. Default `None`.
+        method : str
+            The request method.
+        body : Union[Dict, List, bytes]
+            The request's body - `bytes` are considered to be serialized JSON already and are sent as is. Default
+            `None`.
         query_kwargs : Dict
             A dictionary containing the requests query parameters.
+        query : str
+            The already encoded query string (c.f. `couchdb3.utils.build_query`), used instead of `query_kwargs`.
+            Default is `None`.
         auth_method : str
             Authentication method. Choices are `cookie` or `basic`. Default is `None`.
         root : str
             A root relative to the server's URL, e.g. `"dbname"`. Default is `None`.
         timeout : int
-            The request's timeout. Default c.f. `couchdb3.utils.DEFAULT_TIMEOUT`.
+            The request's read timeout. The connection itself is bounded by the instance's `connect_timeout`, i.e.
+            `requests` receives the tuple `(connect_timeout, timeout)`. Default is the instance's `timeout`.
         req_kwargs
             Further `requests.request` keyword parameters.
         Returns
@@ -213,250 +436,291 @@ class Base(object):
         requests.Response
         """
         auth_method = auth_method or self.auth_method
-        root = root if isinstance(root, str) else self.root
-        path = ""
-        if root:
-            path += root
-        if body:
-            if isinstance(body, dict):
-                body = {k: v for k, v in body.items() if v is not None}
+        if isinstance(root, str):
+            url = f"{self._url_prefix}/{root}" if root else self._url_prefix
+        else:
+            url = self._url
+        if isinstance(body, dict) and any(v is None for v in body.values()):
+            body = {k: v for k, v in body.items() if v is not None}
+        if body is not None:
+            data = body if isinstance(body, bytes) else utils.json_dumps(body)
+            if self.compress_request and len(data) > utils.COMPRESSION_THRESHOLD:
+                data = gzip.compress(data, compresslevel=utils.COMPRESSION_LEVEL)
+                req_kwargs["headers"] = {**req_kwargs.get("headers", {}), "Content-Encoding": "gzip"}
+            req_kwargs["data"] = data
         if resource:
-            path += f"/{resource}"
+            url += f"/{resource}"
+        if query is None and query_kwargs:
+            query = utils.build_query(**query_kwargs)
+        if query:
+            url += f"?{query}"
         if auth_method == "basic":
-            req_kwargs.update({
-                "auth": self._auth
-            })
+            if self._basic_header:
+                # Explicitly passed credentials (c.f. `Server.check_user`) take precedence over the instance's own.
+                req_kwargs["headers"] = {"Authorization": self._basic_header, **req_kwargs.get("headers", {})}
         elif auth_method == "cookie":
             if self._is_auth_token_expired() is True:
-                self._renew_auth_token()
-        response = self.session.request(
-            method=method,
-            url=utils.build_url(
-                scheme=self.scheme,
-                host=self.host,
-                path=path,
-                port=self.port,
-                **(query_kwargs or {})
-            ).url,
-            json=body,
-            timeout=timeout or self.timeout,
-            **req_kwargs
-        )
+                # Double-checked so that concurrent requests renew the token only once.
+                with self._auth_lock:
+                    if self._is_auth_token_expired() is True:
+                        self._renew_auth_token()
+        if self.transport == "httpx":
+            response = self._httpx_request(method=method, url=url, timeout=timeout, **req_kwargs)
+        else:
+            response = self._requests_request(method=method, url=url, timeout=timeout, **req_kwargs)
+        if not _is_read_only(method=method, resource=resource):
+            if self._head_cache:
+                self._head_cache.clear()
+            if self._is_cache_fresh():
+                # Kept bodies served without revalidation must not outlive local writes.
+                self._evict_bodies()
         utils.check_response(response=response)
         return response
 
-    def _delete(
+    # The HTTP method helpers are bound to `_request` directly (instead of wrapping it) to save a Python frame per
+    # request. They accept the same parameters as `_request`, e.g. `self._get("_all_docs", query_kwargs={...})`.
+    _delete = functools.partialmethod(_request, method="DELETE")
+    _get = functools.partialmethod(_request, method="GET")
+    _head = functools.partialmethod(_request, method="HEAD")
+    _post = functools.partialmethod(_request, method="POST")
+    _put = functools.partialmethod(_request, method="PUT")
+
+    def _bulk_request(
             self,
-            resource: str = None,
+            method: str,
+            resources: Iterable[str],
             *,
-            timeout: int = utils.DEFAULT_TIMEOUT,
-            query_kwargs: Dict = None,
-            auth_method: str = None,
-            root: str = None,
-            **req_kwargs
-    ) -> requests.Response:
+            missing_ok: bool = False,
+            **kwargs
+    ) -> List[Optional[requests.Response]]:
         """
-        DELETE request.
+        Send the same kind of request to several resources concurrently. The requests are fanned out over the
+        instance's thread pool and share the session's keep-alive connections.
 
         Parameters
         ----------
-        resource : str
-            The resource to fetch (relative to the host). Default `None`.
-        timeout : int
-            The request's timeout. Default c.f. `couchdb3.utils.DEFAULT_TIMEOUT`.
-        query_kwargs : Dict
-            A dictionary containing the requests query parameters.
-        auth_method : str
-            Authentication method. Choices are `cookie` or `basic`. Default is `None`.
-        root : str
-            A root relative to the server's URL, e.g. `"dbname"`. Default is `None`.
-        req_kwargs
-            Further `requests.request` keyword parameters.
+        method : str
+            The request's method, e.g. `"GET"`.
+        resources : Iterable[str]
+            The resources to fetch (relative to the host).
+        missing_ok : bool
+            If `True`, resources which cannot be found yield `None` instead of raising a
+            `couchdb3.exceptions.NotFoundError` error. Default `False`.
+        kwargs
+            Further `couchdb3.base.Base._request` keyword parameters, applied to every request.
         Returns
         -------
-        requests.Response
+        List[Optional[requests.Response]] : The responses, in the same order as `resources`.
         """
-        return self._request(
-            method="DELETE",
-            resource=resource,
-            timeout=timeout,
-            query_kwargs=query_kwargs,
-            auth_method=auth_method,
-            root=root,
-            **req_kwargs
-        )
+        def request(resource: str) -> Optional[requests.Response]:
+            try:
+                return self._request(method=method, resource=resource, **kwargs)
+            except exceptions.NotFoundError:
+                if missing_ok is False:
+                    raise
+                return None
 
-    def _get(
+        return list(self._executor.map(request, resources))
+
+    def _get_content(
             self,
             resource: str = None,
             *,
-            timeout: int = utils.DEFAULT_TIMEOUT,
             query_kwargs: Dict = None,
-            auth_method: str = None,
-            root: str = None,
             **req_kwargs
-    ) -> requests.Response:
+    ) -> bytes:
         """
-        GET request
+        Send a `GET` request and return the response's body. Bodies served with an `ETag` header are kept so that
+        fetching the same resource again sends an `If-None-Match` header - the server then answers with an empty
+        `304 Not Modified` response if the resource is unchanged and the kept body is returned instead. Kept bodies are
+        returned without any request while `_is_cache_fresh` holds. Once `etag_cache_size` bodies are kept, the least
+        recently used ones are evicted.
 
         Parameters
         ----------
         resource : str
             The resource to fetch (relative to the host). Default `None`.
-        timeout : int
-            The request's timeout. Default c.f. `couchdb3.utils.DEFAULT_TIMEOUT`.
         query_kwargs : Dict
             A dictionary containing the requests query parameters.
-        auth_method : str
-            Authentication method. Choices are `cookie` or `basic`. Default is `None`.
-        root : str
-            A root relative to the server's URL, e.g. `"dbname"`. Default is `None`.
         req_kwargs
-            Further `requests.request` keyword parameters.
+            Further `couchdb3.base.Base._request` keyword parameters.
+
         Returns
         -------
-        requests.Response
+        bytes : The response's raw body.
+        """
+        query = (utils.build_query(**query_kwargs) if query_kwargs else None) or ""
+        size = self.etag_cache_size
+        if size <= 0:
+            return self._get(resource=resource, query=query, **req_kwargs).content
+        key = (resource, query)
+        with self._etag_lock:
+            hit = self._etag_cache.pop(key, None)
+            if hit and self._is_cache_fresh():
+                # Re-inserted as the most recently used body - the cache being evicted in insertion order.
+                self._etag_cache[key] = hit
+                return hit[1]
+            generation = self._etag_generation
+        if hit:
+            req_kwargs["headers"] = {**req_kwargs.get("headers", {}), "If-None-Match": hit[0]}
+        response = self._get(resource=resource, query=query, **req_kwargs)
+        if hit and response.status_code == 304:
+            with self._etag_lock:
+                if generation == self._etag_generation:
+                    self._etag_cache[key] = hit
+            return hit[1]
+        etag = response.headers.get("ETag")
+        if etag:
+            with self._etag_lock:
+                # Bodies fetched while kept ones were being evicted may already be outdated.
+                if generation == self._etag_generation:
+                    while len(self._etag_cache) >= size:
+                        del self._etag_cache[next(iter(self._etag_cache))]
+                    self._etag_cache[key] = (etag, response.content)
+        return response.content
+
+    def _evict_bodies(self) -> None:
+        """
+        Drop the bodies kept by `_get_content` - bodies fetched by requests in flight are not kept either.
+
+        Returns
+        -------
+        None
         """
-        return self._request(
-            method="GET",
-            resource=resource,
-            timeout=timeout,
-            query_kwargs=query_kwargs,
-            auth_method=auth_method,
-            root=root,
-            **req_kwargs
-        )
+        with self._etag_lock:
+            self._etag_generation += 1
+            self._etag_cache.clear()
+
+    def _is_cache_fresh(self) -> bool:
+        """
+        Whether the bodies kept by `_get_content` are known to be up to date, i.e. can be returned without being
+        revalidated by the server - c.f. `couchdb3.database.Database.enable_change_invalidation`.
+
+        Returns
+        -------
+        bool
+        """
+        return False
 
-    def _head(
+    def _head_cached(
             self,
-            resource: str = None,
-            *,
-            timeout: int = utils.DEFAULT_TIMEOUT,
-            query_kwargs: Dict = None,
-            auth_method: str = None,
-            root: str = None,
-            **req_kwargs
-    ) -> requests.Response:
+            resource: str = None
+    ) -> bool:
         """
-        HEAD request
+        Check if a resource exists by sending a `HEAD` request, reusing the outcome of a previous check of the same
+        resource for `head_cache_ttl` seconds.
 
         Parameters
         ----------
         resource : str
             The resource to fetch (relative to the host). Default `None`.
-        timeout : int
-            The request's timeout. Default c.f. `couchdb3.utils.DEFAULT_TIMEOUT`.
-        query_kwargs : Dict
-            A dictionary containing the requests query parameters.
-        auth_method : str
-            Authentication method. Choices are `cookie` or `basic`. Default is `None`.
-        root : str
-            A root relative to the server's URL, e.g. `"dbname"`. Default is `None`.
-        req_kwargs
-            Further `requests.request` keyword parameters.
+
         Returns
         -------
-        requests.Response
+        bool : `True` if the resource exists.
         """
-        return self._request(
-            method="HEAD",
-            resource=resource,
-            timeout=timeout,
-            query_kwargs=query_kwargs,
-            auth_method=auth_method,
-            root=root,
-            **req_kwargs
-        )
-
-    def _post(
+        key = resource or ""
+        if self.head_cache_ttl:
+            hit = self._head_cache.get(key)
+            if hit and hit[0] > time.monotonic():
+                return hit[1]
+        try:
+            self._head(resource=resource)
+            exists = True
+        except exceptions.CouchDBError:
+            exists = False
+        if self.head_cache_ttl:
+            if len(self._head_cache) >= utils.HEAD_CACHE_MAX_SIZE:
+                self._head_cache.clear()
+            self._head_cache[key] = (time.monotonic() + self.head_cache_ttl, exists)
+        return exists
+
+    def _requests_request(
             self,
-            resource: str = None,
             *,
-            body: Union[Dict, List] = None,
-            timeout: int = utils.DEFAULT_TIMEOUT,
-            query_kwargs: Dict = None,
-            auth_method: str = None,
-            root: str = None,
+            method: str,
+            url: str,
+            timeout: int = None,
+            stream: bool = False,
             **req_kwargs
     ) -> requests.Response:
         """
-        POST request
+        Send a request through the instance's `requests.Session`. Unlike `requests.Session.request`, which looks up
+        the environment's proxy and certificate settings for every request, they are looked up once per instance -
+        all of its requests are sent to the same host.
 
         Parameters
         ----------
-        resource : str
-            The resource to fetch (relative to the host). Default `None`.
-        body : Dict
-            The request's body. Default `None`.
+        method : str
+            The request method.
+        url : str
+            The request's absolute URL.
         timeout : int
-            The request's timeout. Default c.f. `couchdb3.utils.DEFAULT_TIMEOUT`.
-        query_kwargs : Union[Dict, List]
-            A dictionary containing the requests query parameters.
-        auth_method : str
-            Authentication method. Choices are `cookie` or `basic`. Default is `None`.
-        root : str
-            A root relative to the server's URL, e.g. `"dbname"`. Default is `None`.
+            The request's read timeout. Default is the instance's `timeout`.
+        stream : bool
+            Whether to defer downloading the response's body. Default `False`.
         req_kwargs
-            Further `requests.request` keyword parameters.
+            Further `requests.Request` keyword parameters, e.g. `headers` or `data`.
         Returns
         -------
         requests.Response
         """
-        return self._request(
-            method="POST",
-            resource=resource,
-            body=body,
-            timeout=timeout,
-            query_kwargs=query_kwargs,
-            auth_method=auth_method,
-            root=root,
-            **req_kwargs
+        if self._send_settings is None:
+            self._send_settings = self.session.merge_environment_settings(self._url_prefix, {}, None, None, None)
+        return self.session.send(
+            self.session.prepare_request(requests.Request(method=method, url=url, **req_kwargs)),
+            timeout=(self.connect_timeout, timeout or self.timeout),
+            allow_redirects=True,
+            **{**self._send_settings, "stream": stream}
         )
 
-    def _put(
+    def _httpx_request(
             self,
-            resource: str = None,
             *,
-            body: Union[Dict, List] = None,
-            timeout: int = utils.DEFAULT_TIMEOUT,
-            query_kwargs: Dict = None,
-            auth_method: str = None,
-            root: str = None,
+            method: str,
+            url: str,
+            timeout: int = None,
             **req_kwargs
-    ) -> requests.Response:
+    ) -> "httpx.Response":
         """
-        PUT request
+        Send a request through the instance's `httpx.Client`, translating the `requests` keyword parameters used
+        throughout the package as well as the raised connection errors.
 
         Parameters
         ----------
-        resource : str
-            The resource to fetch (relative to the host). Default `None`.
-        body : Union[Dict, List]
-            The request's body. Default `None`.
+        method : str
+            The request method.
+        url : str
+            The request's absolute URL.
         timeout : int
-            The request's timeout. Default c.f. `couchdb3.utils.DEFAULT_TIMEOUT`.
-        query_kwargs : Dict
-            A dictionary containing the requests query parameters.
-        auth_method : str
-            Authentication method. Choices are `cookie` or `basic`. Default is `None`.
-        root : str
-            A root relative to the server's URL, e.g. `"dbname"`. Default is `None`.
+            The request's read timeout. Default is the instance's `timeout`.
         req_kwargs
             Further `requests.request` keyword parameters.
         Returns
         -------
-        requests.Response
+        httpx.Response
         """
-        return self._request(
-            method="PUT",
-            resource=resource,
-            body=body,
-            timeout=timeout,
-            query_kwargs=query_kwargs,
-            auth_method=auth_method,
-            root=root,
-            **req_kwargs
-        )
+        if "data" in req_kwargs:
+            req_kwargs["content"] = req_kwargs.pop("data")
+        stream = req_kwargs.pop("stream", False)
+        try:
+            response = self.session.send(
+                self.session.build_request(
+                    method=method,
+                    url=url,
+                    timeout=httpx.Timeout(timeout or self.timeout, connect=self.connect_timeout),
+                    **req_kwargs
+                ),
+                stream=stream
+            )
+            if stream and response.is_error:
+                # Error bodies are read right away, so that they can be reported like non-streamed ones.
+                response.read()
+            return response
+        except httpx.TimeoutException as err:
+            raise requests.exceptions.Timeout(err) from err
+        except httpx.TransportError as err:
+            raise requests.exceptions.ConnectionError(err) from err
 
     def _is_auth_token_expired(self) -> bool:
         """
@@ -466,12 +730,16 @@ class Base(object):
         -------
         bool : `True` if the auth token is expired.
         """
-        try:
-            return next(
-                _.expires for _ in self.session.cookies if _.name == "AuthSession"
-            ) <= datetime.now(timezone.utc).timestamp()
-        except StopIteration:
-            return True
+        now = time.time()
+        if self._auth_expiry > now:
+            return False
+        # Only rescan the cookies once the cached expiry has passed - the token may have been renewed meanwhile, e.g.
+        # by another instance sharing the session.
+        cookies = self.session.cookies.jar if self.transport == "httpx" else self.session.cookies
+        self._auth_expiry = next(
+            (_.expires for _ in cookies if _.name == "AuthSession" and _.expires), 0.0
+        )
+        return self._auth_expiry <= now
 
     def _renew_auth_token(self) -> None:
         """
@@ -495,7 +763,8 @@ class Base(object):
             resource: str = None
     ) -> bool:
         """
-        Check the server or database by sending a `HEAD` request to `/self.root`.
+        Check the server or database by sending a `HEAD` request to `/self.root`. The outcome is reused for
+        `head_cache_ttl` seconds unless the instance sends a mutating request, c.f. `Base.__bool__`.
 
         Parameters
         ----------
@@ -507,9 +776,8 @@ class Base(object):
         bool: `True` if the server is up or the database exists.
         """
         try:
-            utils.check_response(self._head(resource=resource))
-            return True
-        except (exceptions.CouchDBError, requests.exceptions.RequestException):
+            return self._head_cached(resource=resource)
+        except requests.exceptions.RequestException:
             return False
 
     def info(
@@ -528,7 +796,7 @@ class Base(object):
         -------
         Dict: A dictionary containing the server's or database's info.
         """
-        return self._get(resource=f"_partition/{partition}" if partition else None).json()
+        return utils.json_loads(self._get(resource=f"_partition/{partition}" if partition else None).content)
 
     def rev(
             self,
@@ -550,18 +818,80 @@ class Base(object):
         -------
         Optional[str] : The resource's current revision.
         """
-        rev = None
         try:
-            rev = self._head(resource=resource).headers.get("ETag").strip("\"")
+            etag = self._head(resource=resource).headers.get("ETag")
         except exceptions.NotFoundError:
-            pass
-        finally:
-            return rev
+            return None
+        return etag.strip("\"") if etag else None
+
+    def rev_many(
+            self,
+            resources: Iterable[str]
+    ) -> List[Optional[str]]:
+        """
+        Safely retrieves several resources' revisions by sending concurrent `HEAD` requests, c.f.
+        `couchdb3.base.Base.rev`.
+
+        Parameters
+        ----------
+        resources : Iterable[str]
+            The resources to fetch (relative to the host).
+
+        Returns
+        -------
+        List[Optional[str]] : The resources' current revisions, in the same order as `resources` - `None` for resources
+        which cannot be found.
+        """
+        revs = []
+        for response in self._bulk_request("HEAD", resources, missing_ok=True):
+            etag = response.headers.get("ETag") if response is not None else None
+            revs.append(etag.strip("\"") if etag else None)
+        return revs
+
+    def warm_pool(
+            self,
+            connections: int
+    ) -> int:
+        """
+        Open keep-alive connections ahead of time by sending concurrent `HEAD` requests to the server's root, so that
+        the first concurrent requests do not each pay a TCP (and TLS) handshake. The requests are sent on the
+        instance's thread pool, hence at most `pool_size` connections can be opened.
+
+        Parameters
+        ----------
+        connections : int
+            The number of connections to open.
+
+        Returns
+        -------
+        int : The number of successful requests.
+        """
+        # More requests than threads would never all reach the barrier, each waiting for it to time out instead.
+        connections = min(connections, self.pool_size)
+        if connections <= 0:
+            return 0
+        barrier = threading.Barrier(connections)
+
+        def warm(_) -> bool:
+            # Holding the requests back until all of them are ready makes them use distinct connections.
+            try:
+                barrier.wait(timeout=self.connect_timeout)
+            except threading.BrokenBarrierError:
+                pass
+            try:
+                self._head(root="")
+                return True
+            except (exceptions.CouchDBError, requests.exceptions.RequestException):
+                return False
+
+        return sum(self._executor.map(warm, range(connections)))
 
 
 class DictBase(dict):
     """
     Abstract dictionary class.
     """
+    __slots__ = ()
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}: {super(DictBase, self).__repr__()}"
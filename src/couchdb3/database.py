@@ -1,29 +1,226 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 from __future__ import annotations
-from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
+import contextlib
+import itertools
 import mimetypes
 import requests
+import threading
 
 from .base import Base
-from .document import Document, AttachmentDocument, extract_document_id_and_rev, SecurityDocument, \
-    SecurityDocumentElement
-from .exceptions import CouchDBError, NameComplianceError
-from .utils import validate_db_name, DEFAULT_TIMEOUT, partitioned_db_resource_parser
-from .view import ViewResult
+from .document import Document, AttachmentDocument, SecurityDocument, SecurityDocumentElement
+from .exceptions import CouchDBError, NameComplianceError, ERROR_NAME_ERROR_MAPPING
+from .utils import iter_gzip, iter_json_docs, iter_view_rows, json_dumps, json_loads, monotonic_id, validate_db_name, \
+    partitioned_db_resource_parser, BULK_DOCS_STREAM_THRESHOLD, DEFAULT_BACKOFF_FACTOR, DEFAULT_BATCH_SIZE, \
+    DEFAULT_BATCH_WINDOW, DEFAULT_CHANGES_POLL_TIMEOUT, DEFAULT_CONNECT_TIMEOUT, DEFAULT_HEAD_CACHE_TTL, \
+    DEFAULT_MAX_RETRIES, DEFAULT_PAGE_SIZE, DEFAULT_POOL_SIZE, DEFAULT_SAVE_BATCH_SIZE, DEFAULT_TIMEOUT, \
+    DEFAULT_TRANSPORT, ETAG_CACHE_MAX_SIZE, STREAM_CHUNK_SIZE
+from .view import ViewResult, ViewRow
 
 
 __all__ = [
+    "BatchQueue",
     "Database",
     "Partition",
 ]
 
 
+_FIND_FIELDS = (
+    "selector", "limit", "skip", "sort", "fields", "use_index", "conflicts", "r", "bookmark", "update", "stable",
+    "execution_stats",
+)
+"""The body fields of `_find` and `_explain` requests, in the order of the `Database.find` parameters."""
+
+_GET_QUERY_KEYS = (
+    "attachments", "att_encoding_info", "atts_since", "conflicts", "deleted_conflicts", "latest", "local_seq", "meta",
+    "open_revs", "rev", "revs", "revs_info",
+)
+"""The query parameters of document `GET` requests, in the order of the `Database.get` parameters."""
+
+_VIEW_QUERY_KEYS = (
+    "conflicts", "descending", "endkey", "endkey_docid", "group", "group_level", "include_docs", "attachments",
+    "att_encoding_info", "inclusive_end", "key", "limit", "reduce", "skip", "sorted", "stable", "startkey",
+    "startkey_docid", "update", "update_seq",
+)
+"""The query parameters of view requests, in the order of the `Database.view` parameters (`sort` being sent as
+`sorted`)."""
+
+
+def _set_doc_id(doc: Union[Document, Dict], docid: str) -> Union[Document, Dict]:
+    """Set a document's ID in place and return the document."""
+    doc["_id"] = docid
+    return doc
+
+
+# The request builders below return the `_request` keyword parameters (except the method) of an operation, shared by
+# `Database` and `couchdb3.async_database.AsyncDatabase` so that both build the same requests.
+
+def _attachment_document(content: bytes, headers) -> AttachmentDocument:
+    """Build the attachment document of an attachment `GET` response from its body and headers."""
+    return AttachmentDocument(
+        content=content,
+        content_encoding=headers.get("content-encoding"),
+        content_length=headers.get("content-length"),
+        content_type=headers.get("content-type"),
+        digest="md5-" + headers.get("content-md5"),
+    )
+
+
+def _attachment_request(
+        docid: str,
+        attname: str,
+        path: Optional[str],
+        content: Optional[bytes],
+        content_type: Optional[str],
+        rev: Optional[str]
+) -> Dict:
+    """Build an attachment `PUT` request - its body (`path` or `content`) being left to the caller."""
+    if (not content and not path) or (content and path):
+        raise ValueError("Precisely one of the arguments \"path\" and \"content\" must be provided.")
+    if content and not content_type:
+        raise ValueError("Argument \"content_type\" cannot be empty when \"content\" is provided.")
+    return {
+        "resource": f"{docid}/{attname}",
+        "query_kwargs": {"rev": rev},
+        "headers": {"content-type": content_type or mimetypes.guess_type(path)[0]},
+    }
+
+
+def _bulk_get_request(docs: Iterable[Union[Dict, Document]], revs: bool) -> Dict:
+    """Build a `_bulk_get` `POST` request."""
+    return {
+        "resource": "_bulk_get",
+        "body": {
+            # Inlined `extract_document_id_and_rev`, saving a call per document on large requests.
+            "docs": [
+                {"id": i, "rev": r} if r else {"id": i}
+                for i, r in ((_.get("_id") or _.get("id"), _.get("_rev") or _.get("rev")) for _ in docs)
+            ]
+        },
+        "query_kwargs": {"revs": revs},
+    }
+
+
+def _copy_request(docid: str, destid: str, rev: Optional[str], destrev: Optional[str]) -> Dict:
+    """Build a document `COPY` request."""
+    return {
+        "resource": docid,
+        "headers": {"Destination": f"{destid}?rev={destrev}" if destrev else destid},
+        "query_kwargs": {"rev": rev},
+    }
+
+
+def _create_request(doc: Union[Dict, Document], batch: Optional[bool]) -> Dict:
+    """Build a document creation `POST` request."""
+    return {
+        "body": doc,
+        "query_kwargs": {"batch": "ok" if batch is True else None},
+    }
+
+
+def _delete_request(resource: str, rev: str, batch: Optional[bool]) -> Dict:
+    """Build a document (or attachment) `DELETE` request."""
+    return {
+        "resource": resource,
+        "query_kwargs": {"rev": rev, "batch": "ok" if batch is True else None},
+    }
+
+
+def _design_document(
+        ddoc: str,
+        rev: Optional[str],
+        language: Optional[str],
+        options: Optional[Dict],
+        filters: Optional[Dict],
+        updates: Optional[Dict],
+        validate_doc_update: Optional[str],
+        views: Optional[Dict],
+        autoupdate: Optional[bool],
+        partitioned: Optional[bool]
+) -> Dict:
+    """Build a design document, leaving out the fields which are not set."""
+    if partitioned:
+        options = {**(options or {}), "partitioned": partitioned}
+    doc = {"_id": f"_design/{ddoc}"}
+    doc.update((k, v) for k, v in (
+        ("_rev", rev),
+        ("language", language),
+        ("options", options),
+        ("filters", filters),
+        ("updates", updates),
+        ("validate_doc_update", validate_doc_update),
+        ("views", views),
+        ("autoupdate", autoupdate),
+    ) if v is not None)
+    return doc
+
+
+def _find_request(resource: str, partition: Optional[str], *args) -> Dict:
+    """Build a `_find` (or `_explain`) `POST` request from the `Database.find` parameters, in their order."""
+    return {
+        "resource": partitioned_db_resource_parser(resource=resource, partition=partition),
+        "body": {k: v for k, v in zip(_FIND_FIELDS, args) if v is not None},
+    }
+
+
+def _get_request(docid: str, *args) -> Dict:
+    """Build a document `GET` request from the `Database.get` query parameters, in their order."""
+    return {
+        "resource": docid,
+        "query_kwargs": {k: v for k, v in zip(_GET_QUERY_KEYS, args) if v is not None},
+    }
+
+
+def _save_request(
+        doc: Union[Dict, Document],
+        batch: Optional[bool],
+        new_edits: Optional[bool],
+        path: Optional[str]
+) -> Dict:
+    """Build a document `PUT` request."""
+    return {
+        "resource": "%s/%s" % (path, doc.get("_id")) if path else doc.get("_id"),
+        "body": doc,
+        "query_kwargs": {
+            "batch": "ok" if batch else None,
+            "new_edits": new_edits,
+            "rev": doc.get("_rev")
+        },
+    }
+
+
+def _view_request(
+        ddoc: str,
+        view: Optional[str],
+        partition: Optional[str],
+        keys: Optional[Iterable[str]],
+        query_kwargs: Dict
+) -> Dict:
+    """Build a view request - to be sent as a `POST` request if it has a body, i.e. `keys` are given."""
+    request = {"resource": _view_resource(ddoc=ddoc, view=view, partition=partition), "query_kwargs": query_kwargs}
+    if keys is not None:
+        # Keys are sent in the body of a `POST` request so that long lists are not bound by URL length limits.
+        request["body"] = {"keys": list(keys)}
+    return request
+
+
+def _view_resource(ddoc: str, view: Optional[str], partition: Optional[str]) -> str:
+    """Build the resource of a view - `ddoc` being a resource on its own (e.g. `"_all_docs"`) if `view` is not set."""
+    if not (ddoc and view):
+        return ddoc
+    path = partitioned_db_resource_parser(resource="_design", partition=partition)
+    return f"{path}/{ddoc}/_view/{view}"
+
+
 class Database(Base):
     """
     Abstract Couchdb database
     """
+    __slots__ = ("name", "monotonic_ids", "default_view_update", "_changes_stop", "_changes_thread", "_partitions")
+
     def __init__(
             self,
             name: str,
@@ -36,6 +233,16 @@ class Database(Base):
             auth_method: str = None,
             timeout: int = DEFAULT_TIMEOUT,
             session: requests.Session = None,
+            pool_size: int = DEFAULT_POOL_SIZE,
+            connect_timeout: int = DEFAULT_CONNECT_TIMEOUT,
+            head_cache_ttl: float = DEFAULT_HEAD_CACHE_TTL,
+            transport: str = DEFAULT_TRANSPORT,
+            max_retries: int = DEFAULT_MAX_RETRIES,
+            backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+            compress_request: bool = False,
+            etag_cache_size: int = ETAG_CACHE_MAX_SIZE,
+            monotonic_ids: bool = False,
+            default_view_update: str = None,
     ) -> None:
         """
 
@@ -62,7 +269,47 @@ class Database(Base):
         timeout : int
             The default timeout for requests. Default c.f. `couchdb3.utils.DEFAULT_TIMEOUT`.
         session: requests.Session
-            A specific session to use. Optional - if not provided, a new session will be initialized.
+            A specific session to use, either a `requests.Session` or an `httpx.Client`. Optional - if not provided, a
+            new session will be initialized. Sessions provided by the caller are not closed by the instance.
+        pool_size : int
+            The number of pooled keep-alive connections per host of a new session. Ignored if `session` is provided.
+            Default c.f. `couchdb3.utils.DEFAULT_POOL_SIZE`.
+        connect_timeout : int
+            The timeout for establishing a connection, kept apart from the (read) `timeout` so that unreachable hosts
+            fail fast. Default c.f. `couchdb3.utils.DEFAULT_CONNECT_TIMEOUT`.
+        head_cache_ttl : float
+            The number of seconds the outcome of existence checks (`bool(...)`, `in` and `check`) is reused for, so
+            that a check directly followed by the actual request costs a single round-trip. Mutating requests sent by
+            the instance clear the cache, whereas changes made via other instances or clients go unnoticed until the
+            outcome expires. `0` disables it. Default c.f. `couchdb3.utils.DEFAULT_HEAD_CACHE_TTL`.
+        transport : str
+            The HTTP client of a new session. Choices are `requests` or `httpx` - the latter multiplexes concurrent
+            requests over HTTP/2 connections and requires the `httpx` extra. Ignored if `session` is provided, the
+            transport is then inferred from the session's type. Default c.f. `couchdb3.utils.DEFAULT_TRANSPORT`.
+        max_retries : int
+            The number of times idempotent requests failing with a transient error (c.f.
+            `couchdb3.utils.RETRY_STATUS_CODES`) are retried on the pooled connections of a new `requests` session -
+            new `httpx` sessions only retry failed connection attempts. `0` disables retries. Default c.f.
+            `couchdb3.utils.DEFAULT_MAX_RETRIES`.
+        backoff_factor : float
+            The exponential backoff factor between retries - a `Retry-After` header sent by the server takes
+            precedence. Default c.f. `couchdb3.utils.DEFAULT_BACKOFF_FACTOR`.
+        compress_request : bool
+            Whether to gzip request bodies larger than `couchdb3.utils.COMPRESSION_THRESHOLD` bytes. Only enable it if
+            the server (or any proxy in front of it) decodes compressed requests. Default `False`.
+        etag_cache_size : int
+            The maximal number of response bodies kept for conditional `GET` requests (c.f.
+            `couchdb3.base.Base._get_content`), the least recently used ones being evicted first. `0` disables keeping
+            bodies. Default c.f. `couchdb3.utils.ETAG_CACHE_MAX_SIZE`.
+        monotonic_ids : bool
+            Whether `create` and `bulk_docs` assign time-ordered IDs (c.f. `couchdb3.utils.monotonic_id`) to documents
+            without an `_id` instead of leaving it to the server's random UUIDs - sequential IDs keep the server's
+            B-tree appends local. Default `False`.
+        default_view_update : str
+            The `update` parameter of view requests which do not set it, e.g. `"lazy"` to be served the last built index
+            right away (while the server updates it in the background) rather than waiting for the index to catch up
+            with recent writes - i.e. trading fresh results for latency. Default `None`, i.e. the server's default
+            (`"true"`).
         """
         super(Database, self).__init__(
             url=url,
@@ -72,7 +319,15 @@ class Database(Base):
             password=password,
             disable_ssl_verification=disable_ssl_verification,
             auth_method=auth_method,
-            timeout=timeout
+            timeout=timeout,
+            pool_size=pool_size,
+            connect_timeout=connect_timeout,
+            head_cache_ttl=head_cache_ttl,
+            transport=transport,
+            max_retries=max_retries,
+            backoff_factor=backoff_factor,
+            compress_request=compress_request,
+            etag_cache_size=etag_cache_size,
         )
         if validate_db_name(name=name) is False:
             raise NameComplianceError(
@@ -81,6 +336,11 @@ class Database(Base):
             )
         self.name = name
         self.root = name
+        self.monotonic_ids = monotonic_ids
+        self.default_view_update = default_view_update
+        self._changes_stop: Optional[threading.Event] = None
+        self._changes_thread: Optional[threading.Thread] = None
+        self._partitions: Dict[str, Partition] = {}
 
     def __getitem__(self, item) -> Document:
         return self.get(docid=item, check=True)
@@ -123,10 +383,40 @@ class Database(Base):
             **kwargs
         )
 
+    def batched(
+            self,
+            *,
+            max_size: int = DEFAULT_BATCH_SIZE,
+            window: float = DEFAULT_BATCH_WINDOW
+    ) -> BatchQueue:
+        """
+        Get a `BatchQueue` coalescing point operations (`get`, `create`, `save` and `delete`) into `_bulk_get` and
+        `_bulk_docs` requests - sent in the order the operations were queued, e.g.
+
+            with db.batched() as batch:
+                futures = [batch.get(docid) for docid in docids]
+            docs = [_.result() for _ in futures]
+
+        Parameters
+        ----------
+        max_size : int
+            The number of buffered operations which triggers a flush. Default c.f. `couchdb3.utils.DEFAULT_BATCH_SIZE`.
+        window : float
+            The number of seconds operations are buffered for before being flushed by a background timer - `0` disables
+            the timer, operations are then flushed once `max_size` is reached or upon exiting the context manager.
+            Default c.f. `couchdb3.utils.DEFAULT_BATCH_WINDOW`.
+
+        Returns
+        -------
+        BatchQueue
+        """
+        return BatchQueue(database=self, max_size=max_size, window=window)
+
     def bulk_docs(
             self,
             docs: List[Union[Dict, Document]],
-            new_edits: bool = True
+            new_edits: bool = True,
+            batch_size: int = None
     ) -> List[Dict]:
         """
         The bulk document API allows you to create and update multiple documents at the same time within a single
@@ -147,6 +437,10 @@ class Database(Base):
              List of documents objects
         new_edits : bool
             If `False`, prevents the database from assigning them new revision IDs. Default `True`.
+        batch_size : int
+            If set, the documents are sent in consecutive requests of at most `batch_size` documents (e.g.
+            `couchdb3.utils.DEFAULT_SAVE_BATCH_SIZE`) and the results are concatenated in order. Default `None`, i.e. a
+            single request.
 
         Returns
         -------
@@ -156,13 +450,39 @@ class Database(Base):
           - `ok` operation status
           - `rev` the document's revision
         """
-        return self._post(
+        if self.monotonic_ids:
+            docs = [doc if doc.get("_id") is not None else {**doc, "_id": self._new_id()} for doc in docs]
+        if batch_size and len(docs) > batch_size:
+            results = []
+            for i in range(0, len(docs), batch_size):
+                results.extend(self._bulk_docs(docs[i:i + batch_size], new_edits=new_edits))
+            return results
+        return self._bulk_docs(docs, new_edits=new_edits)
+
+    def _bulk_docs(
+            self,
+            docs: List[Union[Dict, Document]],
+            new_edits: bool
+    ) -> List[Dict]:
+        """Send a single `_bulk_docs` request - c.f. `Database.bulk_docs`."""
+        if len(docs) > BULK_DOCS_STREAM_THRESHOLD:
+            data = iter_json_docs(docs, new_edits=new_edits)
+            headers = {}
+            if self.compress_request:
+                data = iter_gzip(data)
+                headers["Content-Encoding"] = "gzip"
+            return json_loads(self._post(
+                resource="_bulk_docs",
+                data=data,
+                headers=headers
+            ).content)
+        return json_loads(self._post(
             resource="_bulk_docs",
             body={
                 "docs": docs,
                 "new_edits": new_edits
             }
-        ).json()
+        ).content)
 
     def bulk_get(
             self,
@@ -190,15 +510,7 @@ class Database(Base):
           the error, or `ok` key and associated value of the requested document, with the additional _revisions property
           that lists the parent revisions if `revs=true`.
         """
-        return self._post(
-            resource="_bulk_get",
-            body={
-                "docs": [extract_document_id_and_rev(_) for _ in docs]
-            },
-            query_kwargs={
-                "revs": revs
-            }
-        ).json().get("results", [])
+        return json_loads(self._post(**_bulk_get_request(docs=docs, revs=revs)).content).get("results", [])
 
     def compact(
             self,
@@ -223,9 +535,11 @@ class Database(Base):
         resource = "_compact"
         if ddoc:
             resource += f"/{ddoc}"
-        return self._post(
+        response = self._post(
             resource=resource
-        ).json().get("ok")
+        )
+        # `202 Accepted` is only sent upon success, sparing the body's parsing.
+        return response.status_code == 202 or json_loads(response.content).get("ok", False)
 
     def copy(
             self,
@@ -254,19 +568,10 @@ class Database(Base):
         -------
         Tuple[str, bool, str] : A tuple consisting of the id, success message & revision.
         """
-        destination = destid
-        if destrev:
-            destination += f"?rev={destrev}"
-        data = self._request(
+        data = json_loads(self._request(
             method="COPY",
-            resource=docid,
-            headers={
-                "Destination": destination,
-            },
-            query_kwargs={
-                "rev": rev
-            }
-        ).json()
+            **_copy_request(docid=docid, destid=destid, rev=rev, destrev=destrev)
+        ).content)
         return data["id"], data["ok"], data["rev"]
 
     def create(
@@ -289,12 +594,9 @@ class Database(Base):
         -------
         Tuple[str, bool, str] : A tuple consisting of the id, success message & revision.
         """
-        data = self._post(
-            body=doc,
-            query_kwargs={
-                "batch": "ok" if batch is True else None
-            }
-        ).json()
+        if self.monotonic_ids and doc.get("_id") is None:
+            doc = {**doc, "_id": self._new_id()}
+        data = json_loads(self._post(**_create_request(doc=doc, batch=batch)).content)
         return data["id"], data["ok"], data["rev"]
 
     def delete(
@@ -320,13 +622,7 @@ class Database(Base):
         -------
         bool : `True` upon successful deletion.
         """
-        self._delete(
-            resource=docid,
-            query_kwargs={
-                "rev": rev,
-                "batch": "ok" if batch is True else None
-            }
-        )
+        self._delete(**_delete_request(resource=docid, rev=rev, batch=batch))
         return True
 
     def delete_attachment(
@@ -355,15 +651,60 @@ class Database(Base):
         -------
         bool : `True` upon successful deletion.
         """
-        self._delete(
-            resource=f"{docid}/{attname}",
-            query_kwargs={
-                "rev": rev,
-                "batch": "ok" if batch is True else None
-            }
-        )
+        self._delete(**_delete_request(resource=f"{docid}/{attname}", rev=rev, batch=batch))
         return True
 
+    def disable_change_invalidation(self) -> None:
+        """
+        Stop following the database's changes feed - c.f. `Database.enable_change_invalidation`. Kept bodies are
+        revalidated by the server again.
+
+        Returns
+        -------
+        None
+        """
+        if self._changes_stop is not None:
+            self._changes_stop.set()
+        self._changes_stop = None
+        self._changes_thread = None
+
+    def enable_change_invalidation(
+            self,
+            poll_timeout: int = DEFAULT_CHANGES_POLL_TIMEOUT
+    ) -> None:
+        """
+        Follow the database's `_changes` feed in a background thread to evict kept response bodies of changed
+        documents (as well as views, `_all_docs` and other `_`-prefixed resources upon any change). While the feed is
+        followed, `get`, `view` and `indexes` return kept bodies without any request - writes made through this
+        instance clear them, writes made by other clients are visible once their change is received.
+
+        If the feed fails (e.g. the server becomes unreachable), the thread stops and kept bodies are revalidated by
+        the server again.
+
+        Parameters
+        ----------
+        poll_timeout : int
+            The number of seconds each long-polling request waits for changes, which also bounds how long the thread
+            lingers after `Database.disable_change_invalidation`. Default c.f.
+            `couchdb3.utils.DEFAULT_CHANGES_POLL_TIMEOUT`.
+
+        Returns
+        -------
+        None
+        """
+        if self._is_cache_fresh():
+            return None
+        since = json_loads(self._get(resource="_changes", query_kwargs={"since": "now"}).content)["last_seq"]
+        # Bodies kept until now may have changed before the feed is followed.
+        self._evict_bodies()
+        self._changes_stop = threading.Event()
+        self._changes_thread = threading.Thread(
+            target=self._follow_changes,
+            args=(self._changes_stop, since, poll_timeout),
+            daemon=True
+        )
+        self._changes_thread.start()
+
     def explain(
             self,
             selector: Dict,
@@ -436,23 +777,10 @@ class Database(Base):
           - range (`Dict`) – Range parameters passed to the underlying view
 
         """
-        return self._post(
-            resource="_explain",
-            body={
-                "selector": selector,
-                "limit": limit,
-                "skip": skip,
-                "sort": sort,
-                "fields": fields,
-                "use_index": use_index,
-                "conflicts": conflicts,
-                "r": r,
-                "bookmark": bookmark,
-                "update": update,
-                "stable": stable,
-                "execution_stats": execution_stats,
-            }
-        ).json()
+        return json_loads(self._post(**_find_request(
+            "_explain", None,
+            selector, limit, skip, sort, fields, use_index, conflicts, r, bookmark, update, stable, execution_stats
+        )).content)
 
     def find(
             self,
@@ -523,26 +851,10 @@ class Database(Base):
           - `docs`
           - `warning`
         """
-        return self._post(
-            resource=partitioned_db_resource_parser(
-                resource="_find",
-                partition=partition,
-            ),
-            body={
-                "selector": selector,
-                "limit": limit,
-                "skip": skip,
-                "sort": sort,
-                "fields": fields,
-                "use_index": use_index,
-                "conflicts": conflicts,
-                "r": r,
-                "bookmark": bookmark,
-                "update": update,
-                "stable": stable,
-                "execution_stats": execution_stats,
-            }
-        ).json()
+        return json_loads(self._post(**_find_request(
+            "_find", partition,
+            selector, limit, skip, sort, fields, use_index, conflicts, r, bookmark, update, stable, execution_stats
+        )).content)
 
     def indexes(
             self,
@@ -557,7 +869,7 @@ class Database(Base):
           - total_rows (`int`) – Number of indexes
           - indexes (`List[Dict]`) – Array of index definitions
         """
-        return self._get(resource="_index").json()
+        return json_loads(self._get_content(resource="_index"))
 
     def get(
             self,
@@ -622,23 +934,10 @@ class Database(Base):
         `couchdb3.document.Document`
         """
         try:
-            return Document(**self._get(
-                resource=docid,
-                query_kwargs={
-                    "attachments": attachments,
-                    "att_encoding_info": att_encoding_info,
-                    "atts_since": atts_since,
-                    "conflicts": conflicts,
-                    "deleted_conflicts": deleted_conflicts,
-                    "latest": latest,
-                    "local_seq": local_seq,
-                    "meta": meta,
-                    "open_revs": open_revs,
-                    "rev": rev,
-                    "revs": revs,
-                    "revs_info": revs_info
-                }
-            ).json())
+            return Document.from_dict(json_loads(self._get_content(**_get_request(
+                docid, attachments, att_encoding_info, atts_since, conflicts, deleted_conflicts, latest, local_seq,
+                meta, open_revs, rev, revs, revs_info
+            ))))
         except (CouchDBError, requests.exceptions.RequestException) as error:
             if check is True:
                 raise error
@@ -670,13 +969,7 @@ class Database(Base):
             f"{docid}/{attname}",
             query_kwargs={"rev": rev}
         )
-        return AttachmentDocument(
-            content=response.content,
-            content_encoding=response.headers.get("content-encoding"),
-            content_length=response.headers.get("content-length"),
-            content_type=response.headers.get("content-type"),
-            digest="md5-" + response.headers.get("content-md5"),
-        )
+        return _attachment_document(content=response.content, headers=response.headers)
 
     def get_design(
             self,
@@ -702,6 +995,172 @@ class Database(Base):
             **kwargs
         )
 
+    def iter_all_docs(
+            self,
+            page_size: int = DEFAULT_PAGE_SIZE,
+            partition: str = None,
+            **kwargs
+    ) -> Iterator[ViewRow]:
+        """
+        Iterate over the rows of the built-in _all_docs view page by page. The next page is fetched in the background
+        while the rows of the current one are consumed, hiding the round-trips behind the caller's processing.
+
+        Parameters
+        ----------
+        page_size : int
+            The number of rows fetched per request. Default c.f. `couchdb3.utils.DEFAULT_PAGE_SIZE`.
+        partition : str
+            Filter using the partition's name (only valid for partitioned databases). Default is `None`.
+        kwargs
+            Further `Database.all_docs` parameters, e.g. `include_docs` or `startkey` (JSON encoded). `keys`, `limit`
+            and `skip` are not supported.
+
+        Returns
+        -------
+        Iterator[ViewRow]
+        """
+        resource = f"_partition/{partition}/_all_docs" if partition else "_all_docs"
+
+        def fetch(startkey: Optional[str], skip: Optional[int]) -> List[ViewRow]:
+            # Pages are streamed so that they are not kept by `Base._get_content` from the thread pool's threads.
+            return list(self.iter_view(resource, limit=page_size, startkey=startkey, skip=skip, **kwargs))
+
+        future = self._executor.submit(fetch, kwargs.pop("startkey", None), None)
+        while True:
+            rows = future.result()
+            if len(rows) < page_size:
+                yield from rows
+                return
+            # The next page starts after the current page's last key.
+            future = self._executor.submit(fetch, json_dumps(rows[-1].key).decode(), 1)
+            yield from rows
+
+    def iter_view(
+            self,
+            ddoc: str,
+            view: str = None,
+            *,
+            partition: str = None,
+            keys: Iterable[str] = None,
+            sort: bool = None,
+            page_size: int = None,
+            **kwargs
+    ) -> Iterator[ViewRow]:
+        """
+        Iterate over the rows of a view while its response is being received, i.e. without loading the whole response
+        into memory - c.f. `couchdb3.utils.iter_view_rows`. Suited for views returning a large number of rows.
+
+        With `page_size`, the rows are fetched with one request per page instead, each page starting right after the
+        last row of the previous one (via `startkey`, `startkey_docid` and `skip=1`). Unlike paging with growing
+        `skip` values, which the server walks row by row, every page then costs the same.
+
+        The requests are sent upon fetching the first row of a page and their connection is released once the
+        page's rows are exhausted or the iterator is closed.
+
+        Parameters
+        ----------
+        ddoc : str
+            The corresponding design document's id.
+        view : str
+            The view's id.
+        partition: str
+            An optional partition ID. Only valid for partitioned databases. (Default `None`.)
+        keys: Iterable[str]
+            Return only documents where the key matches one of the keys specified in the argument. Not supported
+            along with `page_size`. Default is `None`.
+        sort : bool
+            Sort returned rows. Setting this to `False` offers a performance boost. Default is `None`.
+        page_size : int
+            The number of rows fetched per request. Default `None`, i.e. all rows are fetched with a single request.
+        kwargs
+            Further `Database.view` parameters, e.g. `include_docs` or `startkey` (JSON encoded). `limit` and `skip`
+            are not supported along with `page_size`.
+
+        Returns
+        -------
+        Iterator[ViewRow]
+
+        Raises
+        ------
+        ValueError : If `page_size` is given along with `keys`, `limit` or `skip`.
+        """
+        resource = _view_resource(ddoc=ddoc, view=view, partition=partition)
+        query_kwargs = {"update": self.default_view_update, **kwargs, "sorted": sort}
+        if page_size is None:
+            return self._stream_view(resource=resource, keys=keys, query_kwargs=query_kwargs)
+        if keys is not None or kwargs.get("limit") is not None or kwargs.get("skip") is not None:
+            raise ValueError("Argument \"page_size\" cannot be combined with \"keys\", \"limit\" or \"skip\".")
+        return self._page_view(resource=resource, query_kwargs=query_kwargs, page_size=page_size)
+
+    def metadata_snapshot(
+            self,
+            ddocs: Iterable[str] = None
+    ) -> Dict:
+        """
+        Get the database's metadata commonly fetched upon start-up - its info, its indexes and the given design
+        documents - with concurrent requests, i.e. in a single round-trip instead of one per call. The design
+        documents are fetched with a single `_bulk_get` request.
+
+        Parameters
+        ----------
+        ddocs : Iterable[str]
+            The names of the design documents to fetch. Default `None`.
+
+        Returns
+        -------
+        Dict : A dictionary with the following keys.
+
+          - info (`Dict`) – c.f. `Database.info`
+          - indexes (`Dict`) – c.f. `Database.indexes`
+          - designs (`Dict[str, Optional[Document]]`) – the design documents by name, `None` if not found
+        """
+        ddocs = list(ddocs or [])
+        info = self._executor.submit(self.info)
+        indexes = self._executor.submit(self.indexes)
+        designs = {}
+        if ddocs:
+            for ddoc, result in zip(ddocs, self.bulk_get(docs=[{"id": f"_design/{_}"} for _ in ddocs])):
+                doc = result["docs"][0]
+                designs[ddoc] = Document.from_dict(doc["ok"]) if "ok" in doc else None
+        return {
+            "info": info.result(),
+            "indexes": indexes.result(),
+            "designs": designs,
+        }
+
+    def promote_design(
+            self,
+            tmp_ddoc: str,
+            ddoc: str
+    ) -> Tuple[str, bool, str]:
+        """
+        Replace a design document with a staged one by sending a `COPY` request, e.g. to change a view's code without
+        making clients wait for its index to be rebuilt:
+
+            1. Save the new version under a temporary name, e.g. `db.put_design("users-next", views={...})`.
+            2. Query its views until their indexes are built, e.g. `db.view("users-next", "by_name", limit=0)`.
+            3. Promote it, e.g. `db.promote_design("users-next", "users")`.
+
+        Since indexes are identified by their design's content rather than by its name, the promoted design reuses
+        the indexes built for the temporary one. The temporary design may be deleted afterwards.
+
+        Parameters
+        ----------
+        tmp_ddoc : str
+            The name of the staged design document.
+        ddoc : str
+            The name of the design document to replace (or create).
+
+        Returns
+        -------
+        Tuple[str, bool, str] : A tuple consisting of the id, success message & revision.
+        """
+        return self.copy(
+            docid=f"_design/{tmp_ddoc}",
+            destid=f"_design/{ddoc}",
+            destrev=self.rev(f"_design/{ddoc}")
+        )
+
     def purge(
             self,
             data: Dict
@@ -720,10 +1179,10 @@ class Database(Base):
         -------
 
         """
-        return self._post(
+        return json_loads(self._post(
             resource="_purge",
             body=data
-        ).json()
+        ).content)
 
     def put_attachment(
             self,
@@ -764,25 +1223,13 @@ class Database(Base):
           - the operation status (`bool`)
           - the revision ( `str`)
         """
-        if (not content and not path) or (content and path):
-            raise ValueError("Precisely one of the arguments \"attdata\" and  \"attloc\" must be provided.")
-        if content and not content_type:
-            raise ValueError("Argument \"content_type\" cannot be empty when \"content\" is provided.")
-        resource = f"{docid}/{attname}"
-        query_kwargs = {"rev": rev}
-        content_type = content_type if content_type else mimetypes.guess_type(path)[0]
-        if path:
-            with open(path, "rb") as file:
-                content = file.read()
-        response = self._put(
-            resource=resource,
-            query_kwargs=query_kwargs,
-            data=content,
-            headers={
-                "content-type": content_type
-            },
+        request = _attachment_request(
+            docid=docid, attname=attname, path=path, content=content, content_type=content_type, rev=rev
         )
-        data = response.json()
+        # Files are streamed from disk instead of being read into memory first.
+        with open(path, "rb") if path else contextlib.nullcontext(content) as body:
+            response = self._put(data=body, **request)
+        data = json_loads(response.content)
         return data["id"], data["ok"], data["rev"]
 
     def put_design(
@@ -826,7 +1273,9 @@ class Database(Base):
         autoupdate : bool
             Indicates whether to automatically build indexes defined in this design document.
         partitioned : bool
-            Set to `True` for a partitioned design.
+            Set to `True` for a partitioned design, i.e. `options["partitioned"] = True`. In a partitioned database,
+            the views of such designs are queried per partition and hence only hit the shard holding the partition
+            instead of every shard.
         kwargs
         Further `Database.save` parameters.
 
@@ -834,24 +1283,48 @@ class Database(Base):
         -------
         Tuple[str, bool, str] : The document's id ( `str`), the operation status (`bool`) and the revision ( `str`).
         """
-        if partitioned:
-            options = (options or dict()).update({
-                "partitioned": partitioned
-            })
-        return self.save(
-            doc={
-                "_id": f"_design/{ddoc}",
-                "_rev": rev,
-                "language": language,
-                "options": options,
-                "filters": filters,
-                "updates": updates,
-                "validate_doc_update": validate_doc_update,
-                "views": views,
-                "autoupdate": autoupdate
-            },
-            **kwargs
+        doc = _design_document(
+            ddoc=ddoc,
+            rev=rev,
+            language=language,
+            options=options,
+            filters=filters,
+            updates=updates,
+            validate_doc_update=validate_doc_update,
+            views=views,
+            autoupdate=autoupdate,
+            partitioned=partitioned,
         )
+        return self.save(doc=doc, **kwargs)
+
+    def put_designs(
+            self,
+            items: Iterable[Tuple[str, Dict]],
+            *,
+            return_exceptions: bool = False
+    ) -> List[Union[Tuple[str, bool, str], Exception]]:
+        """
+        Create or update several design documents concurrently. Since the requests are independent, they are fanned
+        out over the instance's thread pool, e.g.
+
+            db.put_designs([("users", {"views": {...}}), ("orders", {"views": {...}, "rev": "1-..."})])
+
+        Parameters
+        ----------
+        items : Iterable[Tuple[str, Dict]]
+            Pairs of design document names and `Database.put_design` keyword parameters.
+        return_exceptions : bool
+            If `True`, an item whose request fails yields its exception instead of raising it. Default `False`.
+
+        Returns
+        -------
+        List[Union[Tuple[str, bool, str], Exception]] : The results of `Database.put_design`, in the same order as
+        `items`.
+        """
+        futures = [self._executor.submit(self.put_design, ddoc, **kwargs) for ddoc, kwargs in items]
+        if return_exceptions is False:
+            return [_.result() for _ in futures]
+        return [_.exception() or _.result() for _ in futures]
 
     def save(
             self,
@@ -884,18 +1357,33 @@ class Database(Base):
         """
         :return: 
         """
-        batch = "ok" if batch else None
-        data = self._put(
-            resource="%s/%s" % (path, doc.get("_id")) if path else doc.get("_id"),
-            body=doc,
-            query_kwargs={
-                "batch": "ok" if batch else None,
-                "new_edits": new_edits,
-                "rev": doc.get("_rev")
-            }
-        ).json()
+        data = json_loads(self._put(**_save_request(doc=doc, batch=batch, new_edits=new_edits, path=path)).content)
         return data["id"], data["ok"], data["rev"]
 
+    def save_batched(
+            self,
+            batch_size: int = DEFAULT_SAVE_BATCH_SIZE
+    ) -> BatchQueue:
+        """
+        Get a `BatchQueue` collecting saved documents and sending them as `_bulk_docs` requests of `batch_size`
+        documents - i.e. one round-trip per batch instead of one per document, e.g.
+
+            with db.save_batched() as batch:
+                futures = [batch.save(doc) for doc in docs]
+            results = [_.result() for _ in futures]
+
+        Parameters
+        ----------
+        batch_size : int
+            The number of documents per request. Default c.f. `couchdb3.utils.DEFAULT_SAVE_BATCH_SIZE`.
+
+        Returns
+        -------
+        BatchQueue : A queue without background timer, flushed once `batch_size` documents are buffered or upon
+        exiting the context manager.
+        """
+        return BatchQueue(database=self, max_size=batch_size, window=0)
+
     def save_index(
             self,
             index: Dict,
@@ -935,7 +1423,7 @@ class Database(Base):
           - id (`str`) – Id of the design document the index was created in.
           - name (`str`) – Name of the index created.
         """
-        data = self._post(
+        data = json_loads(self._post(
             resource="_index",
             body={
                 "index": index,
@@ -944,7 +1432,7 @@ class Database(Base):
                 "type": index_type,
                 "partitioned": partitioned
             }
-        ).json()
+        ).content)
         return data["result"], data["id"], data["name"]
 
     def security(
@@ -957,9 +1445,9 @@ class Database(Base):
         -------
         SecurityDocument : A `couchdb3.document.SecurityDocument` object.
         """
-        data = self._get(
+        data = json_loads(self._get(
             resource="_security"
-        ).json()
+        ).content)
         return SecurityDocument(**data)
 
     def update_security(
@@ -983,13 +1471,14 @@ class Database(Base):
         -------
         bool :  Operation status.
         """
-        return self._put(
+        response = self._put(
             resource="_security",
             body={
                 "admins": admins,
                 "members": members
             }
-        ).json()["ok"]
+        )
+        return response.status_code == 200 or json_loads(response.content)["ok"]
 
     def view(
             self,
@@ -1081,7 +1570,7 @@ class Database(Base):
             - `false`
             - `lazy`
 
-            Default is `None`.
+            Default is `None`, i.e. the instance's `default_view_update`.
         update_seq : bool
              Whether to include in the response an `update_seq` value indicating the sequence id of the database the
              view reflects. Default is `False`.
@@ -1090,40 +1579,27 @@ class Database(Base):
         -------
         `view.ViewResult`
         """
-        path = partitioned_db_resource_parser(
-            resource="_design",
+        if update is None:
+            update = self.default_view_update
+        request = _view_request(
+            ddoc=ddoc,
+            view=view,
             partition=partition,
+            keys=keys,
+            query_kwargs={k: v for k, v in zip(_VIEW_QUERY_KEYS, (
+                conflicts, descending, endkey, endkey_docid, group, group_level, include_docs, attachments,
+                att_encoding_info, inclusive_end, key, limit, reduce, skip, sort, stable, startkey, startkey_docid,
+                update, update_seq
+            )) if v is not None}
         )
-        return ViewResult(**self._get(
-            resource=f"{path}/{ddoc}/_view/{view}" if (ddoc and view) else ddoc,
-            query_kwargs={
-                "conflicts": conflicts,
-                "descending": descending,
-                "endkey": endkey,
-                "endkey_docid": endkey_docid,
-                "group": group,
-                "group_level": group_level,
-                "include_docs": include_docs,
-                "attachments": attachments,
-                "att_encoding_info": att_encoding_info,
-                "inclusive_end": inclusive_end,
-                "key": key,
-                "keys": keys,
-                "limit": limit,
-                "reduce": reduce,
-                "skip": skip,
-                "sorted": sort,
-                "stable": stable,
-                "startkey": startkey,
-                "startkey_docid": startkey_docid,
-                "update": update,
-                "update_seq": update_seq
-            }
-        ).json())
+        if "body" in request:
+            return ViewResult.from_bytes(self._post(**request).content)
+        return ViewResult.from_bytes(self._get_content(**request))
 
     def get_partition(self, partition_id: str) -> Partition:
         """
-        Get a given partition.
+        Get a given partition. Partitions are created once per ID and reused afterwards (sharing the instance's
+        session and thread pool), hence they keep the settings the instance had upon the first call.
 
         Parameters
         ----------
@@ -1134,23 +1610,111 @@ class Database(Base):
         -------
         `Partition`
         """
-        return Partition(
-            partition_id=partition_id,
-            name=self.name,
-            url=self.url,
-            port=self.port,
-            user=self._user,
-            password=self._password,
-            disable_ssl_verification=not self.session.verify,
-            auth_method=self.auth_method,
-            session=self.session,
-        )
+        partition = self._partitions.get(partition_id)
+        if partition is not None:
+            return partition
+        return self._partitions.setdefault(partition_id, Partition._from_database(self, partition_id))
+
+    def _follow_changes(
+            self,
+            stop: threading.Event,
+            since: str,
+            poll_timeout: int
+    ) -> None:
+        """
+        Long-poll the `_changes` feed from the given sequence and evict the kept bodies of changed resources until
+        `stop` is set or a request fails.
+
+        Parameters
+        ----------
+        stop : threading.Event
+            The event stopping the thread.
+        since : str
+            The sequence to follow the feed from.
+        poll_timeout : int
+            The number of seconds each request waits for changes.
+
+        Returns
+        -------
+        None
+        """
+        try:
+            while not stop.is_set():
+                data = json_loads(self._get(
+                    resource="_changes",
+                    query_kwargs={
+                        "feed": "longpoll",
+                        "since": since,
+                        "timeout": poll_timeout * 1000
+                    }
+                ).content)
+                since = data["last_seq"]
+                docids = {_["id"] for _ in data.get("results", [])}
+                if docids:
+                    with self._etag_lock:
+                        self._etag_generation += 1
+                        for key in list(self._etag_cache):
+                            if key[0] in docids or (key[0] or "").startswith("_"):
+                                del self._etag_cache[key]
+        except (CouchDBError, requests.exceptions.RequestException):
+            pass
+
+    def _page_view(
+            self,
+            resource: str,
+            query_kwargs: Dict,
+            page_size: int
+    ) -> Iterator[ViewRow]:
+        """
+        Yield the rows of a view with one streamed request per page of `page_size` rows - c.f. `Database.iter_view`.
+        """
+        query_kwargs = {**query_kwargs, "limit": page_size}
+        while True:
+            count = 0
+            for row in self._stream_view(resource=resource, keys=None, query_kwargs=query_kwargs):
+                count += 1
+                yield row
+            if count < page_size:
+                return
+            query_kwargs.update(startkey=json_dumps(row.key).decode(), startkey_docid=row.id, skip=1)
+
+    def _stream_view(
+            self,
+            resource: str,
+            keys: Optional[Iterable[str]],
+            query_kwargs: Dict
+    ) -> Iterator[ViewRow]:
+        """
+        Send a view request and yield its rows while its response is being received - c.f. `Database.iter_view`.
+        """
+        if keys is not None:
+            response = self._post(resource=resource, body={"keys": list(keys)}, query_kwargs=query_kwargs, stream=True)
+        else:
+            response = self._get(resource=resource, query_kwargs=query_kwargs, stream=True)
+        with contextlib.closing(response):
+            if self.transport == "httpx":
+                chunks = response.iter_bytes()
+            else:
+                chunks = response.iter_content(chunk_size=STREAM_CHUNK_SIZE)
+            for row in iter_view_rows(chunks):
+                yield ViewRow(row)
+
+    def _is_cache_fresh(self) -> bool:
+        return self._changes_thread is not None and self._changes_thread.is_alive()
+
+    def _new_id(self) -> str:
+        """
+        Generate the ID of a document created without one, c.f. `couchdb3.utils.monotonic_id`.
+        """
+        return monotonic_id()
 
 
 class Partition(Database):
     """
     Abstract Couchdb partition
     """
+    __slots__ = ("partition_id", "_database", "_partition_prefix")
+
     def __init__(
             self,
             partition_id: str,
@@ -1164,6 +1728,16 @@ class Partition(Database):
             auth_method: str = None,
             timeout: int = DEFAULT_TIMEOUT,
             session: requests.Session = None,
+            pool_size: int = DEFAULT_POOL_SIZE,
+            connect_timeout: int = DEFAULT_CONNECT_TIMEOUT,
+            head_cache_ttl: float = DEFAULT_HEAD_CACHE_TTL,
+            transport: str = DEFAULT_TRANSPORT,
+            max_retries: int = DEFAULT_MAX_RETRIES,
+            backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+            compress_request: bool = False,
+            etag_cache_size: int = ETAG_CACHE_MAX_SIZE,
+            monotonic_ids: bool = False,
+            default_view_update: str = None,
     ) -> None:
         """
 
@@ -1190,7 +1764,47 @@ class Partition(Database):
         timeout : int
             The default timeout for requests. Default c.f. `couchdb3.utils.DEFAULT_TIMEOUT`.
         session: requests.Session
-            A specific session to use. Optional - if not provided, a new session will be initialized.
+            A specific session to use, either a `requests.Session` or an `httpx.Client`. Optional - if not provided, a
+            new session will be initialized. Sessions provided by the caller are not closed by the instance.
+        pool_size : int
+            The number of pooled keep-alive connections per host of a new session. Ignored if `session` is provided.
+            Default c.f. `couchdb3.utils.DEFAULT_POOL_SIZE`.
+        connect_timeout : int
+            The timeout for establishing a connection, kept apart from the (read) `timeout` so that unreachable hosts
+            fail fast. Default c.f. `couchdb3.utils.DEFAULT_CONNECT_TIMEOUT`.
+        head_cache_ttl : float
+            The number of seconds the outcome of existence checks (`bool(...)`, `in` and `check`) is reused for, so
+            that a check directly followed by the actual request costs a single round-trip. Mutating requests sent by
+            the instance clear the cache, whereas changes made via other instances or clients go unnoticed until the
+            outcome expires. `0` disables it. Default c.f. `couchdb3.utils.DEFAULT_HEAD_CACHE_TTL`.
+        transport : str
+            The HTTP client of a new session. Choices are `requests` or `httpx` - the latter multiplexes concurrent
+            requests over HTTP/2 connections and requires the `httpx` extra. Ignored if `session` is provided, the
+            transport is then inferred from the session's type. Default c.f. `couchdb3.utils.DEFAULT_TRANSPORT`.
+        max_retries : int
+            The number of times idempotent requests failing with a transient error (c.f.
+            `couchdb3.utils.RETRY_STATUS_CODES`) are retried on the pooled connections of a new `requests` session -
+            new `httpx` sessions only retry failed connection attempts. `0` disables retries. Default c.f.
+            `couchdb3.utils.DEFAULT_MAX_RETRIES`.
+        backoff_factor : float
+            The exponential backoff factor between retries - a `Retry-After` header sent by the server takes
+            precedence. Default c.f. `couchdb3.utils.DEFAULT_BACKOFF_FACTOR`.
+        compress_request : bool
+            Whether to gzip request bodies larger than `couchdb3.utils.COMPRESSION_THRESHOLD` bytes. Only enable it if
+            the server (or any proxy in front of it) decodes compressed requests. Default `False`.
+        etag_cache_size : int
+            The maximal number of response bodies kept for conditional `GET` requests (c.f.
+            `couchdb3.base.Base._get_content`), the least recently used ones being evicted first. `0` disables keeping
+            bodies. Default c.f. `couchdb3.utils.ETAG_CACHE_MAX_SIZE`.
+        monotonic_ids : bool
+            Whether `create` and `bulk_docs` assign time-ordered IDs (c.f. `couchdb3.utils.monotonic_id`) to documents
+            without an `_id` instead of leaving it to the server's random UUIDs - sequential IDs keep the server's
+            B-tree appends local. Default `False`.
+        default_view_update : str
+            The `update` parameter of view requests which do not set it, e.g. `"lazy"` to be served the last built index
+            right away (while the server updates it in the background) rather than waiting for the index to catch up
+            with recent writes - i.e. trading fresh results for latency. Default `None`, i.e. the server's default
+            (`"true"`).
         """
         super(Partition, self).__init__(
             name=name,
@@ -1201,14 +1815,92 @@ class Partition(Database):
             password=password,
             disable_ssl_verification=disable_ssl_verification,
             auth_method=auth_method,
-            timeout=timeout
+            timeout=timeout,
+            pool_size=pool_size,
+            connect_timeout=connect_timeout,
+            head_cache_ttl=head_cache_ttl,
+            transport=transport,
+            max_retries=max_retries,
+            backoff_factor=backoff_factor,
+            compress_request=compress_request,
+            etag_cache_size=etag_cache_size,
+            monotonic_ids=monotonic_ids,
+            default_view_update=default_view_update,
         )
         self.partition_id = partition_id
+        self._database = None
+        self._partition_prefix = f"{partition_id}:"
         # self.root = f"{name}/_partition/{partition_id}"
 
     def __repr__(self) -> str:
         return f"{super(Partition, self).__repr__()}/{self.partition_id}"
 
+    @classmethod
+    def _from_database(
+            cls,
+            database: Database,
+            partition_id: str
+    ) -> Partition:
+        """
+        Create a partition of an existing database without running `__init__` - its settings, session, thread pool
+        and `HEAD` cache are shared by reference instead of being set up again, and bodies are kept by the database
+        (c.f. `Base._get_content`).
+
+        Parameters
+        ----------
+        database : Database
+            The partitioned database.
+        partition_id : str
+            The partition's ID.
+
+        Returns
+        -------
+        `Partition`
+        """
+        self = cls.__new__(cls)
+        for klass in type(database).__mro__:
+            for slot in getattr(klass, "__slots__", ()):
+                if slot != "__weakref__" and hasattr(database, slot):
+                    setattr(self, slot, getattr(database, slot))
+        # The database's session and thread pool are not the partition's to close (c.f. `Base.__exit__`) - the thread
+        # pool is used via `Partition._executor`.
+        self._finalizer = None
+        self._owns_session = False
+        self._thread_pool = None
+        self._changes_stop = None
+        self._changes_thread = None
+        self.partition_id = partition_id
+        self._database = database
+        self._partition_prefix = f"{partition_id}:"
+        return self
+
+    def _evict_bodies(self) -> None:
+        if self._database is None:
+            return super(Partition, self)._evict_bodies()
+        return self._database._evict_bodies()
+
+    @property
+    def _executor(self) -> ThreadPoolExecutor:
+        if self._database is None:
+            return super(Partition, self)._executor
+        return self._database._executor
+
+    def _get_content(
+            self,
+            resource: str = None,
+            *,
+            query_kwargs: Dict = None,
+            **req_kwargs
+    ) -> bytes:
+        if self._database is None:
+            return super(Partition, self)._get_content(resource=resource, query_kwargs=query_kwargs, **req_kwargs)
+        return self._database._get_content(resource=resource, query_kwargs=query_kwargs, **req_kwargs)
+
+    def _is_cache_fresh(self) -> bool:
+        if self._database is None:
+            return super(Partition, self)._is_cache_fresh()
+        return self._database._is_cache_fresh()
+
     def all_docs(
             self,
             keys: Iterable[str] = None,
@@ -1367,7 +2059,7 @@ class Partition(Database):
             - `false`
             - `lazy`
 
-            Default is `None`.
+            Default is `None`, i.e. the instance's `default_view_update`.
         update_seq : bool
              Whether to include in the response an `update_seq` value indicating the sequence id of the database the
              view reflects. Default is `False`.
@@ -1403,10 +2095,34 @@ class Partition(Database):
             update_seq=update_seq
         )
 
+    # noinspection PyMethodOverriding
+    def iter_all_docs(
+            self,
+            page_size: int = DEFAULT_PAGE_SIZE,
+            **kwargs
+    ) -> Iterator[ViewRow]:
+        """
+        See `Database.iter_all_docs`.
+        """
+        return super(Partition, self).iter_all_docs(page_size=page_size, partition=self.partition_id, **kwargs)
+
+    # noinspection PyMethodOverriding
+    def iter_view(
+            self,
+            ddoc: str,
+            view: str = None,
+            **kwargs
+    ) -> Iterator[ViewRow]:
+        """
+        See `Database.iter_view`.
+        """
+        return super(Partition, self).iter_view(ddoc=ddoc, view=view, partition=self.partition_id, **kwargs)
+
     def bulk_docs(
             self,
             docs: List[Union[Dict, Document]],
-            new_edits: bool = True
+            new_edits: bool = True,
+            batch_size: int = None
     ) -> List[Dict]:
         """
         See `Database.bulk_docs`.
@@ -1414,9 +2130,15 @@ class Partition(Database):
         Note:
         Appends the partition's ID to the documents' ID.
         """
+        prefix = self._partition_prefix
         return super(Partition, self).bulk_docs(
-            docs=[self.add_partition_to_doc(doc) for doc in docs],
+            # Documents without ID (`prefix` then being a stand-in) and already prefixed ones are passed as is.
+            docs=[
+                doc if (doc.get("_id") or prefix).startswith(prefix) else _set_doc_id(doc, prefix + doc["_id"])
+                for doc in docs
+            ],
             new_edits=new_edits,
+            batch_size=batch_size,
         )
 
     def bulk_get(
@@ -1430,8 +2152,13 @@ class Partition(Database):
         Note:
         Appends the partition's ID to the documents' ID.
         """
+        prefix = self._partition_prefix
         return super(Partition, self).bulk_get(
-            docs=[self.add_partition_to_doc(doc) for doc in docs],
+            # Documents without ID (`prefix` then being a stand-in) and already prefixed ones are passed as is.
+            docs=[
+                doc if (doc.get("_id") or prefix).startswith(prefix) else _set_doc_id(doc, prefix + doc["_id"])
+                for doc in docs
+            ],
             revs=revs,
         )
 
@@ -1634,16 +2361,209 @@ class Partition(Database):
         """
         Append the instance's partition ID to a string.
         """
-        if string.startswith(self.partition_id):
-            return string
-        return f"{self.partition_id}:{string}"
+        return string if string.startswith(self._partition_prefix) else self._partition_prefix + string
+
+    def _new_id(self) -> str:
+        """
+        See `Database._new_id`.
+
+        Note:
+        Appends the partition's ID to the document's ID.
+        """
+        return self.add_partition_to_str(monotonic_id())
 
     def add_partition_to_doc(self, doc: Union[Document, Dict]) -> Union[Document, Dict]:
         """
         Append the instance's partition ID to the document's ID.
         """
         docid = doc.get("_id")
-        if docid is None:
-            return doc
-        doc["_id"] = self.add_partition_to_str(docid)
+        if docid is not None and not docid.startswith(self._partition_prefix):
+            doc["_id"] = self._partition_prefix + docid
         return doc
+
+
+class BatchQueue(object):
+    """
+    Buffers point operations on a database and flushes them as `_bulk_get`/`_bulk_docs` requests, trading a few
+    milliseconds of latency for a single round-trip per batch. Every operation returns a `concurrent.futures.Future`
+    resolved upon flushing, hence operations may be issued from several threads sharing the queue. The operations are
+    sent in the order they were queued, consecutive reads (or writes) sharing a request - a `get` queued after a
+    `save` of the same document hence returns the saved document.
+    """
+    def __init__(
+            self,
+            database: Database,
+            *,
+            max_size: int = DEFAULT_BATCH_SIZE,
+            window: float = DEFAULT_BATCH_WINDOW
+    ) -> None:
+        """
+
+        Parameters
+        ----------
+        database : Database
+            The database the operations are sent to.
+        max_size : int
+            The number of buffered operations which triggers a flush. Default c.f. `couchdb3.utils.DEFAULT_BATCH_SIZE`.
+        window : float
+            The number of seconds operations are buffered for before being flushed by a background timer - `0` disables
+            the timer. Default c.f. `couchdb3.utils.DEFAULT_BATCH_WINDOW`.
+        """
+        self.database = database
+        self.max_size = max_size
+        self.window = window
+        self._lock = threading.Lock()
+        self._pending: List[Tuple[str, Any, Future]] = []
+        self._timer: Optional[threading.Timer] = None
+
+    def __enter__(self) -> BatchQueue:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.flush()
+
+    def create(
+            self,
+            doc: Union[Dict, Document]
+    ) -> Future:
+        """
+        Queue the creation of a document - c.f. `Database.create`.
+
+        Parameters
+        ----------
+        doc : Union[Dict, couchdb3.document.Document]
+            A dictionary or a `couchdb3.document.Document` instance to be created.
+
+        Returns
+        -------
+        Future : Resolved with a tuple consisting of the id, success message & revision.
+        """
+        return self._enqueue("create", doc)
+
+    def delete(
+            self,
+            docid: str,
+            rev: str
+    ) -> Future:
+        """
+        Queue the deletion of a document - c.f. `Database.delete`.
+
+        Parameters
+        ----------
+        docid : str
+            The document's id.
+        rev : str
+            The document's current revision.
+
+        Returns
+        -------
+        Future : Resolved with `True` upon successful deletion.
+        """
+        return self._enqueue("delete", {"_id": docid, "_rev": rev, "_deleted": True})
+
+    def save(
+            self,
+            doc: Union[Dict, Document]
+    ) -> Future:
+        """
+        Queue the creation or update of a document - c.f. `Database.save`.
+
+        Parameters
+        ----------
+        doc : Union[Dict, couchdb3.document.Document]
+            A dictionary or a `couchdb3.document.Document` instance, with a revision (`doc["_rev"]`) in case of an
+            update.
+
+        Returns
+        -------
+        Future : Resolved with a tuple consisting of the id, success message & revision.
+        """
+        return self._enqueue("save", doc)
+
+    def get(
+            self,
+            docid: str
+    ) -> Future:
+        """
+        Queue the retrieval of a document - c.f. `Database.get`.
+
+        Parameters
+        ----------
+        docid : str
+            The document's id.
+
+        Returns
+        -------
+        Future : Resolved with a `couchdb3.document.Document` or `None` if the document cannot be found.
+        """
+        return self._enqueue("get", docid)
+
+    def flush(self) -> None:
+        """
+        Send the buffered operations and resolve their futures.
+
+        Returns
+        -------
+        None
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        for read, ops in itertools.groupby(pending, key=lambda _: _[0] == "get"):
+            self._flush(list(ops), self._flush_reads if read else self._flush_writes)
+
+    def _enqueue(
+            self,
+            op: str,
+            item: Any
+    ) -> Future:
+        future = Future()
+        with self._lock:
+            self._pending.append((op, item, future))
+            full = len(self._pending) >= self.max_size
+            if not full and self._timer is None and self.window > 0:
+                self._timer = threading.Timer(self.window, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        if full:
+            self.flush()
+        return future
+
+    @staticmethod
+    def _flush(
+            pending: List[Tuple[str, Any, Future]],
+            func
+    ) -> None:
+        try:
+            func(pending)
+        except Exception as error:
+            for _, _, future in pending:
+                if not future.done():
+                    future.set_exception(error)
+
+    def _flush_reads(
+            self,
+            pending: List[Tuple[str, Any, Future]]
+    ) -> None:
+        # Keyed by `_id` so that partitions prefix the IDs, c.f. `Partition.bulk_get`.
+        results = self.database.bulk_get(docs=[{"_id": docid} for _, docid, _ in pending])
+        for (_, _, future), result in zip(pending, results):
+            doc = result["docs"][0]
+            future.set_result(Document.from_dict(doc["ok"]) if "ok" in doc else None)
+
+    def _flush_writes(
+            self,
+            pending: List[Tuple[str, Any, Future]]
+    ) -> None:
+        rows = self.database.bulk_docs(docs=[doc for _, doc, _ in pending])
+        for (op, _, future), row in zip(pending, rows):
+            if "error" in row:
+                future.set_exception(
+                    ERROR_NAME_ERROR_MAPPING.get(row["error"], CouchDBError)(row.get("reason", row["error"]))
+                )
+            elif op == "delete":
+                future.set_result(True)
+            else:
+                future.set_result((row["id"], row.get("ok", True), row["rev"]))
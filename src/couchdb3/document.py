@@ -2,7 +2,8 @@
 # -*- coding: utf-8 -*-
 
 from __future__ import annotations
-from typing import Dict, List, Optional, Union
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 from .base import DictBase
 
@@ -33,22 +34,46 @@ def extract_document_id_and_rev(
     -------
     Dict : A dictionary containing the (optional) keys `id` and `rev`.
     """
-    res = {}
-    i = doc.get("_id", doc.get("id"))
-    r = doc.get("_rev", doc.get("rev"))
-    if i:
-        res.update({
-            "id": i
-        })
-    if r and rev is True:
-        res.update({
-            "rev": r
-        })
-    return res
+    g = doc.get
+    i = g("_id") or g("id")
+    r = (g("_rev") or g("rev")) if rev is True else None
+    if r:
+        return {"id": i, "rev": r} if i else {"rev": r}
+    return {"id": i} if i else {}
+
+
+_EMPTY: Tuple = ()
+"""Shared default for unset security names and roles."""
+
+
+def _insort_unique(lst: List[str], item: str) -> List[str]:
+    """Insert `item` into the sorted list `lst` unless it is already present, and return `lst`."""
+    i = bisect_left(lst, item)
+    if i == len(lst) or lst[i] != item:
+        lst.insert(i, item)
+    return lst
 
 
 class Document(DictBase):
     """CouchDB Document - a wrapper around Python dictionaries."""
+    __slots__ = ()
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Document":
+        """
+        Build a document from a (deserialized) dictionary. Passing the dictionary positionally lets `dict` copy it in
+        C, whereas `Document(**data)` first unpacks every top-level field into a temporary keyword dictionary.
+
+        Parameters
+        ----------
+        data : Dict
+            The document's content.
+
+        Returns
+        -------
+        Document
+        """
+        return cls(data)
 
     @property
     def id(self) -> Optional[str]:
@@ -61,7 +86,7 @@ class Document(DictBase):
 
     @id.setter
     def id(self, value: str) -> None:
-        self.update({"_id": value})
+        self["_id"] = value
 
     @property
     def rev(self) -> Optional[str]:
@@ -74,11 +99,12 @@ class Document(DictBase):
 
     @rev.setter
     def rev(self, value: str) -> None:
-        self.update({"_rev": value})
+        self["_rev"] = value
 
 
 class AttachmentDocument(DictBase):
     """CouchDB Attachment Document - a wrapper around Python dictionaries."""
+    __slots__ = ()
 
     def __init__(
             self,
@@ -86,11 +112,9 @@ class AttachmentDocument(DictBase):
             **kwargs
     ) -> None:
         super(AttachmentDocument, self).__init__(*args, **kwargs)
-        self.content = self.get("content")
-        self.content_encoding = self.get("content_encoding")
-        self.content_length = self.get("content_length")
-        self.content_type = self.get("content_type")
-        self.digest = self.get("digest")
+        length = self.get("content_length")
+        if length is not None and length.__class__ is not int:
+            self["content_length"] = int(length)
 
     @property
     def content(self) -> bytes:
@@ -103,9 +127,7 @@ class AttachmentDocument(DictBase):
 
     @content.setter
     def content(self, value: bytes) -> None:
-        self.update({
-            "content": value
-        })
+        self["content"] = value
 
     @property
     def content_encoding(self) -> str:
@@ -118,9 +140,7 @@ class AttachmentDocument(DictBase):
 
     @content_encoding.setter
     def content_encoding(self, value: str) -> None:
-        self.update({
-            "content_encoding": value
-        })
+        self["content_encoding"] = value
 
     @property
     def content_length(self) -> int:
@@ -133,9 +153,7 @@ class AttachmentDocument(DictBase):
 
     @content_length.setter
     def content_length(self, value: int) -> None:
-        self.update({
-            "content_length": int(value)
-        })
+        self["content_length"] = value if value.__class__ is int else int(value)
 
     @property
     def content_type(self) -> str:
@@ -148,9 +166,7 @@ class AttachmentDocument(DictBase):
 
     @content_type.setter
     def content_type(self, value: str) -> None:
-        self.update({
-            "content_type": value
-        })
+        self["content_type"] = value
 
     @property
     def digest(self) -> str:
@@ -163,92 +179,100 @@ class AttachmentDocument(DictBase):
 
     @digest.setter
     def digest(self, value: str) -> None:
-        self.update({
-            "digest": value
-        })
+        self["digest"] = value
 
 
 class SecurityDocumentElement(DictBase):
     """CouchDB Security Document Element (representing either `"admins"` or `"members"`) - a wrapper around Python
     dictionaries."""
+    __slots__ = ()
+
+    def __init__(
+            self,
+            *args,
+            **kwargs
+    ) -> None:
+        super(SecurityDocumentElement, self).__init__(*args, **kwargs)
+        for key in ("names", "roles"):
+            if key in self:
+                self[key] = sorted(set(self[key]))
 
     def add_name(self, name: str) -> None:
-        self.names = sorted(set(self.names).union({name}))
+        names = self.get("names")
+        self["names"] = [name] if names is None else _insort_unique(names, name)
+
+    def add_names(self, names: Iterable[str]) -> None:
+        self["names"] = sorted(set(self.get("names", _EMPTY)).union(names))
 
     def add_role(self, role: str) -> None:
-        self.roles = sorted(set(self.roles).union({role}))
+        roles = self.get("roles")
+        self["roles"] = [role] if roles is None else _insort_unique(roles, role)
+
+    def add_roles(self, roles: Iterable[str]) -> None:
+        self["roles"] = sorted(set(self.get("roles", _EMPTY)).union(roles))
 
     @property
-    def names(self) -> List[str]:
+    def names(self) -> Sequence[str]:
         """
         Returns
         -------
-        List[str] : The document's names.
+        Sequence[str] : The document's names - an empty tuple if none are set. Use `add_name` to add names.
         """
-        return self.get("names", [])
+        return self.get("names", _EMPTY)
 
     @names.setter
-    def names(self, value) -> None:
-        self.update({
-            "names": value
-        })
+    def names(self, value: List[str]) -> None:
+        self["names"] = sorted(set(value))
 
     @property
-    def roles(self) -> List[str]:
+    def roles(self) -> Sequence[str]:
         """
         Returns
         -------
-        List[str] : The document's roles.
+        Sequence[str] : The document's roles - an empty tuple if none are set. Use `add_role` to add roles.
         """
-        return self.get("roles", [])
+        return self.get("roles", _EMPTY)
 
     @roles.setter
-    def roles(self, value) -> None:
-        self.update({
-            "roles": value
-        })
+    def roles(self, value: List[str]) -> None:
+        self["roles"] = sorted(set(value))
     
 
 class SecurityDocument(DictBase):
-    """CouchDB Security Document - a wrapper around Python dictionaries."""
-    
-    def __init__(
-            self,
-            *args,
-            **kwargs
-    ) -> None:
-        super(SecurityDocument, self).__init__(*args, **kwargs)
-        self.admins = SecurityDocumentElement(**self.get("admins", {}))
-        self.members = SecurityDocumentElement(**self.get("members", {}))
-    
+    """CouchDB Security Document - a wrapper around Python dictionaries. The `admins` and `members` elements are
+    wrapped as `SecurityDocumentElement` objects on first access."""
+    __slots__ = ()
+
+    def _element(self, key: str) -> SecurityDocumentElement:
+        value = self.get(key)
+        if not isinstance(value, SecurityDocumentElement):
+            value = self[key] = SecurityDocumentElement(value or ())
+        return value
+
     @property
     def admins(self) -> SecurityDocumentElement:
         """
         Returns
         -------
-        SecurityDocument : The document's admins.
+        SecurityDocumentElement : The document's admins.
         """
-        return self.get("admins", SecurityDocumentElement())
+        return self._element("admins")
     
     @admins.setter
     def admins(self, value: SecurityDocumentElement) -> None:
-        self.update({
-            "admins": value
-        })
+        self["admins"] = value
 
     @property
     def members(self) -> SecurityDocumentElement:
         """
         Returns
         -------
-        SecurityDocument : The document's members.
+        SecurityDocumentElement : The document's members.
         """
-        return self.get("members", SecurityDocumentElement())
+        return self._element("members")
 
     @members.setter
     def members(self, value: SecurityDocumentElement) -> None:
-        self.update({
-            "members": value
-        })
+        self["members"] = value
 
     
\ No newline at end of file
@@ -1,12 +1,14 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-from typing import Dict
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Type
 
 
 __all__ = [
     "CouchDBError",
     "AuthenticationMethodError",
+    "TransportMethodError",
     "NameComplianceError",
     "ProxySchemeComplianceError",
     "UserIDComplianceError",
@@ -23,44 +25,59 @@ __all__ = [
     "RequestRangeNotSatisfiableError",
     "ExpectationFailedError",
     "InternalServerError",
-    "STATUS_CODE_ERROR_MAPPING"
+    "ERROR_NAME_ERROR_MAPPING",
+    "STATUS_CODE_ERROR_MAPPING",
+    "error_for_status"
 ]
 
 
 class CouchDBError(Exception):
     """CouchDB Error"""
+    __slots__ = ()
 
 
 class AuthenticationMethodError(CouchDBError):
     """Authentication method is not allowed."""
+    __slots__ = ()
+
+
+class TransportMethodError(CouchDBError):
+    """Transport (HTTP client) is not supported."""
+    __slots__ = ()
 
 
 class NameComplianceError(CouchDBError):
     """Database name does not comply with the CouchDB requirements. For more information please refer to [the official
     documentation](https://docs.couchdb.org/en/main/api/database/common.html#put--db)."""
+    __slots__ = ()
 
 
 class ProxySchemeComplianceError(CouchDBError):
     """Proxy scheme does not comply with the CouchDB requirements. For more information please refer to [the official
     documentation](https://docs.couchdb.org/en/main/api/server/common.html#replicate)"""
+    __slots__ = ()
 
 
 class UserIDComplianceError(CouchDBError):
     """User ID does not comply with the CouchDB requirements. For more information please refer to [the official
     documentation](https://docs.couchdb.org/en/main/intro/security.html#org-couchdb-user)"""
+    __slots__ = ()
 
 
 class BadRequestError(CouchDBError):
     """Bad request structure. The error can indicate an error with the request URL, path or headers. Differences in the
     supplied MD5 hash and content also trigger this error, as this may indicate message corruption."""
+    __slots__ = ()
 
 
 class UnauthorizedError(CouchDBError):
     """The item requested was not available using the supplied authorization, or authorization was not supplied."""
+    __slots__ = ()
 
 
 class ForbiddenError(CouchDBError):
     """The requested item or operation is forbidden."""
+    __slots__ = ()
 
 
 class NotFoundError(CouchDBError):
@@ -70,48 +87,59 @@ class NotFoundError(CouchDBError):
     {"error":"not_found","reason":"no_db_file"}
     ```
     """
+    __slots__ = ()
 
 
 class MethodNotAllowedError(CouchDBError):
     """A request was made using an invalid HTTP request type for the URL requested. For example, you have requested a
     `PUT` when a `POST` is required. Errors of this type can also triggered by invalid URL strings."""
+    __slots__ = ()
 
 
 class NotAcceptableError(CouchDBError):
     """The requested content type is not supported by the server."""
+    __slots__ = ()
 
 
 class ConflictError(CouchDBError):
     """Request resulted in an update conflict."""
+    __slots__ = ()
 
 
 class PreconditionFailedError(CouchDBError):
     """The request headers from the client and the capabilities of the server do not match."""
+    __slots__ = ()
 
 
 class RequestEntityTooLargeError(CouchDBError):
     """A document exceeds the configured `couchdb3/max_document_size` value or the entire request exceeds the
     `chttpd/max_http_request_size` value"""
+    __slots__ = ()
 
 
 class UnsupportedMediaTypeError(CouchDBError):
     """Content type error."""
+    __slots__ = ()
 
 
 class RequestRangeNotSatisfiableError(CouchDBError):
     """The range specified in the request header cannot be satisfied by the server."""
+    __slots__ = ()
 
 
 class ExpectationFailedError(CouchDBError):
     """When sending documents in bulk, the bulk load operation failed."""
+    __slots__ = ()
 
 
 class InternalServerError(CouchDBError):
     """The request was invalid, either because the supplied JSON was invalid, or invalid information was supplied as
     part of the request."""
+    __slots__ = ()
 
 
-STATUS_CODE_ERROR_MAPPING: Dict = {
+# Read-only, so that it cannot drift from the status-indexed tuple behind `error_for_status`.
+STATUS_CODE_ERROR_MAPPING: Mapping = MappingProxyType({
     200: None,
     201: None,
     202: None,
@@ -129,4 +157,34 @@ STATUS_CODE_ERROR_MAPPING: Dict = {
     416: RequestRangeNotSatisfiableError,
     417: ExpectationFailedError,
     500: InternalServerError
+})
+
+
+ERROR_NAME_ERROR_MAPPING: Dict = {
+    "bad_request": BadRequestError,
+    "conflict": ConflictError,
+    "forbidden": ForbiddenError,
+    "not_found": NotFoundError,
+    "unauthorized": UnauthorizedError,
 }
+
+
+# Error classes indexed by `status - 400`, so resolving a response's status is a single tuple index.
+_ERRORS_BY_OFFSET = tuple(STATUS_CODE_ERROR_MAPPING.get(400 + _) for _ in range(118))
+
+
+def error_for_status(status: int) -> Optional[Type[CouchDBError]]:
+    """
+    Get the error class mapped to an HTTP status code.
+
+    Parameters
+    ----------
+    status : int
+        An HTTP status code.
+
+    Returns
+    -------
+    Optional[Type[CouchDBError]] : The mapped `CouchDBError` subclass or `None` if the status is not mapped to an
+    error.
+    """
+    return _ERRORS_BY_OFFSET[status - 400] if 400 <= status < 518 else None
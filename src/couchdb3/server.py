@@ -2,12 +2,15 @@
 # -*- coding: utf-8 -*-
 
 import requests
-from typing import Dict, List, Tuple, Union
+from typing import Dict, Iterable, List, Tuple, Union
 
 from .base import Base
 from .database import Database
-from .exceptions import ConflictError, CouchDBError, NotFoundError, ProxySchemeComplianceError, UserIDComplianceError
-from .utils import user_name_to_id, validate_proxy, validate_user_id, DEFAULT_TIMEOUT
+from .exceptions import ConflictError, CouchDBError, NotFoundError, ProxySchemeComplianceError, UnauthorizedError, \
+    UserIDComplianceError
+from .utils import basic_auth, json_loads, user_name_to_id, validate_proxy, validate_user_id, DEFAULT_BACKOFF_FACTOR, \
+    DEFAULT_CONNECT_TIMEOUT, DEFAULT_HEAD_CACHE_TTL, DEFAULT_MAX_RETRIES, DEFAULT_POOL_SIZE, DEFAULT_SAVE_BATCH_SIZE, \
+    DEFAULT_TIMEOUT, DEFAULT_TRANSPORT, ETAG_CACHE_MAX_SIZE
 
 
 __all__ = [
@@ -19,6 +22,8 @@ class Server(Base):
     """
     Abstract Couchdb client
     """
+    __slots__ = ()
+
     def __init__(
             self,
             url: str,
@@ -30,6 +35,14 @@ class Server(Base):
             auth_method: str = None,
             timeout: int = DEFAULT_TIMEOUT,
             session: requests.Session = None,
+            pool_size: int = DEFAULT_POOL_SIZE,
+            connect_timeout: int = DEFAULT_CONNECT_TIMEOUT,
+            head_cache_ttl: float = DEFAULT_HEAD_CACHE_TTL,
+            transport: str = DEFAULT_TRANSPORT,
+            max_retries: int = DEFAULT_MAX_RETRIES,
+            backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+            compress_request: bool = False,
+            etag_cache_size: int = ETAG_CACHE_MAX_SIZE,
     ) -> None:
         """
 
@@ -54,7 +67,38 @@ class Server(Base):
         timeout : int
             The default timeout for requests. Default c.f. `couchdb3.utils.DEFAULT_TIMEOUT`.
         session: requests.Session
-            A specific session to use. Optional - if not provided, a new session will be initialized.
+            A specific session to use, either a `requests.Session` or an `httpx.Client`. Optional - if not provided, a
+            new session will be initialized. Sessions provided by the caller are not closed by the instance.
+        pool_size : int
+            The number of pooled keep-alive connections per host of a new session. Ignored if `session` is provided.
+            Default c.f. `couchdb3.utils.DEFAULT_POOL_SIZE`.
+        connect_timeout : int
+            The timeout for establishing a connection, kept apart from the (read) `timeout` so that unreachable hosts
+            fail fast. Default c.f. `couchdb3.utils.DEFAULT_CONNECT_TIMEOUT`.
+        head_cache_ttl : float
+            The number of seconds the outcome of existence checks (`bool(...)`, `in` and `check`) is reused for, so
+            that a check directly followed by the actual request costs a single round-trip. Mutating requests sent by
+            the instance clear the cache, whereas changes made via other instances or clients go unnoticed until the
+            outcome expires. `0` disables it. Default c.f. `couchdb3.utils.DEFAULT_HEAD_CACHE_TTL`.
+        transport : str
+            The HTTP client of a new session. Choices are `requests` or `httpx` - the latter multiplexes concurrent
+            requests over HTTP/2 connections and requires the `httpx` extra. Ignored if `session` is provided, the
+            transport is then inferred from the session's type. Default c.f. `couchdb3.utils.DEFAULT_TRANSPORT`.
+        max_retries : int
+            The number of times idempotent requests failing with a transient error (c.f.
+            `couchdb3.utils.RETRY_STATUS_CODES`) are retried on the pooled connections of a new `requests` session -
+            new `httpx` sessions only retry failed connection attempts. `0` disables retries. Default c.f.
+            `couchdb3.utils.DEFAULT_MAX_RETRIES`.
+        backoff_factor : float
+            The exponential backoff factor between retries - a `Retry-After` header sent by the server takes
+            precedence. Default c.f. `couchdb3.utils.DEFAULT_BACKOFF_FACTOR`.
+        compress_request : bool
+            Whether to gzip request bodies larger than `couchdb3.utils.COMPRESSION_THRESHOLD` bytes. Only enable it if
+            the server (or any proxy in front of it) decodes compressed requests. Default `False`.
+        etag_cache_size : int
+            The maximal number of response bodies kept for conditional `GET` requests (c.f.
+            `couchdb3.base.Base._get_content`), the least recently used ones being evicted first. `0` disables keeping
+            bodies. Default c.f. `couchdb3.utils.ETAG_CACHE_MAX_SIZE`.
         """
         super(Server, self).__init__(
             url=url,
@@ -65,6 +109,14 @@ class Server(Base):
             auth_method=auth_method,
             timeout=timeout,
             session=session,
+            pool_size=pool_size,
+            connect_timeout=connect_timeout,
+            head_cache_ttl=head_cache_ttl,
+            transport=transport,
+            max_retries=max_retries,
+            backoff_factor=backoff_factor,
+            compress_request=compress_request,
+            etag_cache_size=etag_cache_size,
         )
 
     def __getitem__(self, item) -> Database:
@@ -92,9 +144,38 @@ class Server(Base):
         -------
         List[Dict]
         """
-        return self._get(
+        return json_loads(self._get(
             resource="_active_tasks"
-        ).json()
+        ).content)
+
+    def bulk_docs(
+            self,
+            db: str,
+            docs: List[Dict],
+            new_edits: bool = True,
+            batch_size: int = DEFAULT_SAVE_BATCH_SIZE
+    ) -> List[Dict]:
+        """
+        Create or update multiple documents of a database in batched `_bulk_docs` requests - c.f.
+        `couchdb3.database.Database.bulk_docs`.
+
+        Parameters
+        ----------
+        db : str
+            The name of the database.
+        docs : List[Dict]
+            List of documents objects.
+        new_edits : bool
+            If `False`, prevents the database from assigning them new revision IDs. Default `True`.
+        batch_size : int
+            The maximum number of documents per request. Default c.f. `couchdb3.utils.DEFAULT_SAVE_BATCH_SIZE`.
+
+        Returns
+        -------
+        List[Dict] : A list of dictionaries containing the keys `id`, `ok` and `rev` (or `error` and `reason`), in the
+        order of `docs`.
+        """
+        return self.get(name=db).bulk_docs(docs=docs, new_edits=new_edits, batch_size=batch_size)
 
     def check_user(
             self,
@@ -102,8 +183,9 @@ class Server(Base):
             password: str
     ) -> bool:
         """
-        Checks the username/password combination by creating a `Server` instance and performing a `Server.check`
-        request.
+        Checks the username/password combination by sending a `GET` request to `/_session` with the given credentials
+        as basic authentication. The request goes through the instance's session (i.e. its keep-alive connections)
+        without sending or storing any session cookie, so the instance's own authentication is left untouched.
 
         Parameters
         ----------
@@ -116,11 +198,20 @@ class Server(Base):
         -------
         bool : A boolean indicating if the username/password combination is valid.
         """
-        return Server(
-            url=self.url,
-            user=username,
-            password=password
-        ).check()
+        try:
+            response = self._get(
+                resource="_session",
+                auth_method="basic",
+                root="",
+                headers={
+                    "Authorization": f"Basic {basic_auth(user=username, password=password)}",
+                    # An explicit (empty) cookie header keeps the session's `AuthSession` cookie from being sent.
+                    "Cookie": ""
+                }
+            )
+        except UnauthorizedError:
+            return False
+        return json_loads(response.content).get("userCtx", {}).get("name") == username
 
     def save_user(
             self,
@@ -174,14 +265,92 @@ class Server(Base):
           - the user ID ( `str`)
           - the current revision ( `str`)
         """
+        body = self._user_document(
+            name,
+            user_id=user_id,
+            derived_key=derived_key,
+            roles=roles,
+            password=password,
+            password_sha=password_sha,
+            password_scheme=password_scheme,
+            salt=salt,
+            iterations=iterations,
+            rev=rev
+        )
+        resource = f"_users/{body['_id']}"
+        try:
+            response = self._put(
+                resource=resource,
+                body=body
+            )
+        except ConflictError:
+            body["_rev"] = self.rev(resource)
+            response = self._put(
+                resource=resource,
+                body=body
+            )
+        data = json_loads(response.content)
+        return data["ok"], data["id"], data["rev"]
+
+    def save_users(
+            self,
+            users: List[Dict],
+            batch_size: int = DEFAULT_SAVE_BATCH_SIZE
+    ) -> List[Dict]:
+        """
+        Create or update several users at once. The current revisions of the users given without `rev` are fetched
+        with a single `_bulk_get` request and the user documents are then saved via `_bulk_docs` - i.e. two requests
+        (per `batch_size` users) instead of up to three per user with `Server.save_user`.
+
+        Parameters
+        ----------
+        users : List[Dict]
+            List of dictionaries holding the keyword parameters of `Server.save_user`, e.g.
+            `[{"name": "alice", "password": "secret", "roles": ["reader"]}]`.
+        batch_size : int
+            The maximum number of users per `_bulk_docs` request. Default c.f.
+            `couchdb3.utils.DEFAULT_SAVE_BATCH_SIZE`.
+
+        Returns
+        -------
+        List[Dict] : A list of dictionaries containing the keys `id`, `ok` and `rev` (or `error` and `reason`), in the
+        order of `users`.
+        """
+        docs = [self._user_document(**_) for _ in users]
+        db = self.get(name="_users")
+        missing = [_ for _ in docs if not _["_rev"]]
+        if missing:
+            for doc, result in zip(missing, db.bulk_get(docs=[{"id": _["_id"]} for _ in missing])):
+                found = result["docs"][0].get("ok")
+                if found:
+                    doc["_rev"] = found["_rev"]
+        for doc in docs:
+            if not doc["_rev"]:
+                del doc["_rev"]
+        return db.bulk_docs(docs=docs, batch_size=batch_size)
+
+    @staticmethod
+    def _user_document(
+            name: str,
+            *,
+            user_id: str = None,
+            derived_key: str = None,
+            roles: List[str] = None,
+            password: str = None,
+            password_sha: str = None,
+            password_scheme: str = None,
+            salt: str = None,
+            iterations: int = None,
+            rev: str = None
+    ) -> Dict:
+        """Build (and validate) a user document - c.f. `Server.save_user`."""
         if user_id and validate_user_id(user_id=user_id) is False:
             raise UserIDComplianceError(
                 "User ID does not comply with the CouchDB requirements. "
                 "See https://docs.couchdb.org/en/main/intro/security.html#why-the-org-couchdb-user-prefix."
             )
-        user_id = user_id or user_name_to_id(name)
-        body = {
-            "_id": user_id,
+        return {
+            "_id": user_id or user_name_to_id(name),
             "_rev": rev,
             "derived_key": derived_key,
             "name": name,
@@ -193,19 +362,6 @@ class Server(Base):
             "iterations": iterations,
             "type": "user"
         }
-        try:
-            response = self._put(
-                resource=f"_users/{user_id}",
-                body=body
-            )
-        except ConflictError:
-            body.update({"_rev": self.rev(f"_users/{user_id}")})
-            response = self._put(
-                resource=f"_users/{user_id}",
-                body=body
-            )
-        data = response.json()
-        return data["ok"], data["id"], data["rev"]
 
     def all_dbs(
             self,
@@ -236,7 +392,7 @@ class Server(Base):
         -------
         List[str] : A list of database names.
         """
-        return self._get(
+        return json_loads(self._get(
             "_all_dbs",
             query_kwargs={
                 "descending": descending,
@@ -245,7 +401,7 @@ class Server(Base):
                 "skip": skip,
                 "startkey": startkey,
             }
-        ).json()
+        ).content)
 
     def create(
             self,
@@ -300,12 +456,12 @@ class Server(Base):
         -------
         List[Dict] : A list dictionaries containing the corresponding database info.
         """
-        return self._post(
+        return json_loads(self._post(
             resource="_dbs_info",
             body={
                 "keys": keys
             }
-        ).json()
+        ).content)
 
     def get(
             self,
@@ -327,23 +483,67 @@ class Server(Base):
         couchdb3.database.Database
 
         """
-        db = Database(
+        db = self._database(name=name)
+        try:
+            db._head()
+        except (NotFoundError, requests.exceptions.RequestException) as error:
+            if check is True:
+                raise error
+        except CouchDBError as error:
+            raise error
+        return db
+
+    def _database(
+            self,
+            name: str
+    ) -> Database:
+        """
+        Create a database instance sharing the server's session and settings, without checking it exists.
+        """
+        return Database(
             name=name,
             url=self.url,
             user=self._user,
             password=self._password,
-            disable_ssl_verification=not self.session.verify,
+            disable_ssl_verification=self.disable_ssl_verification,
             auth_method=self.auth_method,
+            timeout=self.timeout,
             session=self.session,
+            connect_timeout=self.connect_timeout,
+            head_cache_ttl=self.head_cache_ttl,
+            compress_request=self.compress_request,
+            etag_cache_size=self.etag_cache_size,
         )
+
+    def get_many(
+            self,
+            names: Iterable[str],
+            check: bool = False
+    ) -> List[Database]:
+        """
+        Get several databases by name. The existence checks of `Server.get` are sent concurrently, c.f.
+        `couchdb3.base.Base._bulk_request`, e.g.
+
+            dbs = client.get_many(client.all_dbs())
+
+        Parameters
+        ----------
+        names : Iterable[str]
+            The names of the databases.
+        check : bool
+            If `True`, raise an exception if any of the databases cannot be found in the server. Default `False`.
+
+        Returns
+        -------
+        List[couchdb3.database.Database] : The databases, in the same order as `names`.
+        """
+        names = list(names)
         try:
-            db._head()
-        except (NotFoundError, requests.exceptions.RequestException) as error:
+            self._bulk_request("HEAD", names, missing_ok=check is False)
+        except requests.exceptions.RequestException as error:
             if check is True:
                 raise error
-        except CouchDBError as error:
-            raise error
-        return db
+        return [self._database(name=_) for _ in names]
 
     def delete(
             self,
@@ -451,7 +651,7 @@ class Server(Base):
             raise ProxySchemeComplianceError("Proxy has invalid scheme.")
         if sum(bool(_) for _ in [doc_ids, filter_func, selector]) > 1:
             raise CouchDBError("Arguments \"doc_ids\", \"filter_func\" and \"selector\" are mutually exclusive.")
-        return self._post(
+        return json_loads(self._post(
             resource="_replicator",
             body={
                 "_id": replication_id,
@@ -467,7 +667,7 @@ class Server(Base):
                 "source_proxy": source_proxy,
                 "target_proxy": target_proxy
             }
-        ).json()
+        ).content)
 
     def up(self) -> bool:
         """
@@ -4,15 +4,30 @@
 import base64
 from collections.abc import Generator
 from enum import Enum
+import functools
+import json
 import mimetypes
 import re
 import requests
-from typing import Any, Dict, Optional, Set, Type
+import secrets
+import time
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, Optional, Set, Tuple, Type, Union
 from urllib import parse
 from urllib3.util import Url, parse_url
+import zlib
 
 from . import exceptions
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
 
 __all__ = [
     "basic_auth",
@@ -22,21 +37,52 @@ __all__ = [
     "validate_auth_method",
     "validate_db_name",
     "validate_proxy",
+    "validate_transport",
     "validate_user_id",
     "check_response",
     "extract_url_data",
+    "iter_gzip",
+    "iter_json_docs",
+    "iter_view_rows",
+    "json_dumps",
+    "json_loads",
+    "monotonic_id",
     "partitioned_db_resource_parser",
     "COUCHDB_USERS_DB_NAME",
     "COUCHDB_REPLICATOR_DB_NAME",
     "COUCHDB_GLOBAL_CHANGES_DB_NAME",
     "COUCH_DB_RESERVED_DB_NAMES",
+    "BULK_DOCS_STREAM_THRESHOLD",
+    "COMPRESSION_LEVEL",
+    "COMPRESSION_THRESHOLD",
     "DEFAULT_AUTH_METHOD",
+    "DEFAULT_BACKOFF_FACTOR",
+    "DEFAULT_BATCH_SIZE",
+    "DEFAULT_BATCH_WINDOW",
+    "DEFAULT_CHANGES_POLL_TIMEOUT",
+    "DEFAULT_CONNECT_TIMEOUT",
+    "DEFAULT_CONNECTION_LIMIT",
+    "DEFAULT_HEAD_CACHE_TTL",
+    "DEFAULT_KEEPALIVE_TIMEOUT",
+    "DEFAULT_MAX_RETRIES",
+    "DEFAULT_PAGE_SIZE",
+    "DEFAULT_POOL_SIZE",
+    "DEFAULT_SAVE_BATCH_SIZE",
     "DEFAULT_TIMEOUT",
+    "DEFAULT_TRANSPORT",
+    "ETAG_CACHE_MAX_SIZE",
+    "HEAD_CACHE_MAX_SIZE",
     "MimeTypeEnum",
     "PATTERN_DB_NAME",
     "PATTERN_USER_ID",
+    "READ_ONLY_POST_ENDPOINTS",
+    "RETRY_METHODS",
+    "RETRY_STATUS_CODES",
+    "STREAM_CHUNK_SIZE",
+    "USER_ID_PREFIX",
     "VALID_AUTH_METHODS",
     "VALID_SCHEMES",
+    "VALID_TRANSPORTS",
 ]
 
 
@@ -54,34 +100,126 @@ COUCH_DB_RESERVED_DB_NAMES: Set[str] = {
 }
 """Reserved CouchDB database names."""
 
+BULK_DOCS_STREAM_THRESHOLD: int = 1000
+"""The number of documents above which bulk requests are serialized incrementally and sent chunked - values to
+`1000`."""
+
+COMPRESSION_LEVEL: int = 1
+"""The gzip compression level of request bodies - values to `1`, since JSON compresses well at the fastest level and
+higher levels mostly add CPU time."""
+
+COMPRESSION_THRESHOLD: int = 4096
+"""The minimal size in bytes of request bodies which are compressed (if enabled) - values to `4096`."""
+
 DEFAULT_AUTH_METHOD: str = "cookie"
 """The default authentication method - values to `\"cookie\"`."""
 
+DEFAULT_BACKOFF_FACTOR: float = 0.25
+"""The default backoff factor between retried requests - values to `0.25`."""
+
+DEFAULT_BATCH_SIZE: int = 100
+"""The default number of buffered point operations which triggers a batch flush - values to `100`."""
+
+DEFAULT_BATCH_WINDOW: float = 0.005
+"""The default number of seconds point operations are buffered for before a batch flush - values to `0.005`."""
+
+DEFAULT_CHANGES_POLL_TIMEOUT: int = 30
+"""The default number of seconds a long-polling `_changes` request waits for changes - values to `30`."""
+
+DEFAULT_CONNECT_TIMEOUT: int = 5
+"""The default timeout for establishing a connection - values to `5`."""
+
+DEFAULT_CONNECTION_LIMIT: int = 100
+"""The default maximal number of simultaneous connections of asynchronous sessions - values to `100`."""
+
+DEFAULT_HEAD_CACHE_TTL: float = 1
+"""The default number of seconds the outcome of existence checks is cached for - values to `1`."""
+
+DEFAULT_KEEPALIVE_TIMEOUT: int = 60
+"""The default number of seconds idle connections of asynchronous sessions are kept alive - values to `60`."""
+
+DEFAULT_MAX_RETRIES: int = 5
+"""The default number of times failed idempotent requests are retried - values to `5`."""
+
+DEFAULT_PAGE_SIZE: int = 1000
+"""The default number of rows fetched per request when iterating over views - values to `1000`."""
+
+DEFAULT_POOL_SIZE: int = 32
+"""The default number of pooled keep-alive connections per host - values to `32`."""
+
+DEFAULT_SAVE_BATCH_SIZE: int = 500
+"""The default number of documents per `_bulk_docs` request of `Database.save_batched` - values to `500`."""
+
 DEFAULT_TIMEOUT: int = 300
 """The default timeout set in requests - values to `300`."""
 
-MimeTypeEnum: Type[Enum] = Enum(
-    'MimeTypeEnum',
-    {'mime_type_' + k.removeprefix('.'): v for k, v in mimetypes.types_map.items()}
-)
-"""An Enum containing all existing mime types."""
+DEFAULT_TRANSPORT: str = "requests"
+"""The default HTTP client of new sessions - values to `\"requests\"`."""
+
+ETAG_CACHE_MAX_SIZE: int = 128
+"""The default maximal number of response bodies per instance kept for conditional `GET` requests (c.f. the
+`etag_cache_size` parameter) - values to `128`."""
+
+HEAD_CACHE_MAX_SIZE: int = 1024
+"""The maximal number of cached existence checks per instance - values to `1024`."""
 
 PATTERN_DB_NAME: re.Pattern = re.compile(r"^[a-z][a-z0-9_$()+/-]*$")
 """The pattern for valid database names."""
 PATTERN_USER_ID: re.Pattern = re.compile(r"^org\.couchdb\.user:.*")
 """The pattern for valid user IDs."""
 
+READ_ONLY_POST_ENDPOINTS: FrozenSet[str] = frozenset({
+    "_all_docs", "_bulk_get", "_design_docs", "_explain", "_find", "_local_docs", "_session"
+})
+"""The endpoints whose `POST` requests only read data (as do the ones of views) and hence keep the existence checks
+and bodies cached by an instance."""
+
+RETRY_METHODS: FrozenSet[str] = frozenset({"DELETE", "GET", "HEAD", "PUT"})
+"""The idempotent request methods which are retried. `POST` is left out since e.g. bulk document requests are not
+idempotent."""
+RETRY_STATUS_CODES: FrozenSet[int] = frozenset({429, 502, 503, 504})
+"""The transient response status codes which are retried. CouchDB's `500` errors are deterministic (e.g. invalid JSON)
+and thus not retried."""
+
+STREAM_CHUNK_SIZE: int = 65536
+"""The size in bytes of the chunks of streamed request bodies - values to `65536`."""
+
+USER_ID_PREFIX: str = "org.couchdb.user:"
+"""The prefix of the IDs of user documents - c.f. `PATTERN_USER_ID`."""
+
 VALID_AUTH_METHODS: Set[str] = {"basic", "cookie"}
 """The valid auth method arguments. Possible values are `\"basic\"` or `\"cookie\"`."""
 VALID_SCHEMES: Set[str] = {"http", "https", "socks5"}
 """The valid TCP schemes. Possible values are `\"http\"` or `\"https\"` or `\"socks5\"`."""
+VALID_TRANSPORTS: Set[str] = {"httpx", "requests"}
+"""The valid transport arguments. Possible values are `\"httpx\"` or `\"requests\"`."""
+
+_VALID_SCHEME_PREFIXES: Tuple[str, ...] = tuple(f"{_}://" for _ in sorted(VALID_SCHEMES))
+"""The URL prefixes of `VALID_SCHEMES`, as a tuple to be passed to `str.startswith` at once."""
+
+
+@functools.lru_cache(maxsize=None)
+def _mime_type_enum() -> Type[Enum]:
+    return Enum(
+        'MimeTypeEnum',
+        {'mime_type_' + k.removeprefix('.'): v for k, v in mimetypes.types_map.items()}
+    )
+
+
+def __getattr__(name: str) -> Any:
+    # `MimeTypeEnum` (an Enum containing all existing mime types) is only built upon first access, sparing every
+    # import of the package an Enum member per known mime type.
+    if name == "MimeTypeEnum":
+        return _mime_type_enum()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def _handler(x: Any) -> str:
-    if isinstance(x, (Generator, map, list, set, tuple)):
-        return "[%s]" % ",".join(f"\"{_handler(_)}\"" for _ in x)
-    elif isinstance(x, dict):
-        return str({key: _handler(val) for key, val in x.items()})
+    # Strings are passed as is - e.g. view keys are handed over already JSON-encoded by the callers.
+    if isinstance(x, (Generator, map, set, tuple)):
+        x = list(x)
+    if isinstance(x, (list, dict)):
+        return json_dumps(x).decode()
     elif isinstance(x, bool):
         return str(x).lower()
     return str(x)
@@ -108,6 +246,160 @@ def basic_auth(
     return base64.b64encode(f"{user}:{password}".encode()).decode()
 
 
+def json_dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to JSON. Uses `orjson` if installed, then `ujson` and falls back to the standard library's
+    `json` module otherwise. Every request body is serialized here - all three produce the same bytes, non-ASCII
+    characters being sent as is rather than escaped.
+
+    Parameters
+    ----------
+    obj : Any
+        A JSON serializable object.
+
+    Returns
+    -------
+    bytes : The compact, UTF-8 encoded JSON document.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    if ujson is not None:
+        return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False).encode()
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """
+    Deserialize a JSON document. Uses `orjson` if installed, then `ujson` and falls back to the standard library's
+    `json` module otherwise.
+
+    Parameters
+    ----------
+    data : Union[bytes, str]
+        A JSON document, e.g. a response's raw `content`.
+
+    Returns
+    -------
+    Any : The deserialized object.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if ujson is not None:
+        return ujson.loads(data)
+    return json.loads(data)
+
+
+def iter_json_docs(
+        docs: Iterable[Dict],
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        **fields
+) -> Iterator[bytes]:
+    """
+    Serialize a bulk request body, i.e. `{**fields, "docs": [...]}`, document by document so that the whole payload is
+    never held in memory at once. Passed as a request's `data`, the body is sent with `Transfer-Encoding: chunked`.
+
+    Parameters
+    ----------
+    docs : Iterable[Dict]
+        The documents to serialize.
+    chunk_size : int
+        The (approximate) size in bytes of the yielded chunks. Default c.f. `couchdb3.utils.STREAM_CHUNK_SIZE`.
+    fields
+        Further top level fields of the body, e.g. `new_edits=False`.
+
+    Returns
+    -------
+    Iterator[bytes] : The serialized body's chunks.
+    """
+    buffer = bytearray(b"{")
+    for key, val in fields.items():
+        buffer += json_dumps(key) + b":" + json_dumps(val) + b","
+    buffer += b"\"docs\":["
+    for i, doc in enumerate(docs):
+        if i:
+            buffer += b","
+        buffer += json_dumps(doc)
+        if len(buffer) >= chunk_size:
+            yield bytes(buffer)
+            buffer.clear()
+    buffer += b"]}"
+    yield bytes(buffer)
+
+
+def iter_gzip(
+        chunks: Iterable[bytes],
+        compresslevel: int = COMPRESSION_LEVEL
+) -> Iterator[bytes]:
+    """
+    Gzip a streamed body chunk by chunk.
+
+    Parameters
+    ----------
+    chunks : Iterable[bytes]
+        The body's chunks, e.g. as yielded by `couchdb3.utils.iter_json_docs`.
+    compresslevel : int
+        The compression level. Default c.f. `couchdb3.utils.COMPRESSION_LEVEL`.
+
+    Returns
+    -------
+    Iterator[bytes] : The compressed body's chunks.
+    """
+    compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def iter_view_rows(
+        chunks: Iterable[bytes]
+) -> Iterator[Dict]:
+    """
+    Parse the rows of a streamed view response one by one, so that the whole response is never held in memory at once.
+    CouchDB writes every row of a view (or `_all_docs`) response on its own line, i.e.
+
+        {"total_rows":2,"offset":0,"rows":[
+        {"id":"doc-1","key":"doc-1","value":{"rev":"1-..."}},
+        {"id":"doc-2","key":"doc-2","value":{"rev":"1-..."}}
+        ]}
+
+    Parameters
+    ----------
+    chunks : Iterable[bytes]
+        The response body's chunks.
+
+    Returns
+    -------
+    Iterator[Dict] : The parsed rows.
+    """
+    buffer = b""
+    in_rows = False
+    for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            line = line.strip()
+            if not in_rows:
+                in_rows = line.endswith(b"[")
+            elif line.startswith(b"]"):
+                return
+            elif line:
+                yield json_loads(line[:-1] if line.endswith(b",") else line)
+
+
+def monotonic_id() -> str:
+    """
+    Generate a document ID that sorts by creation time: 16 hex digits of `time.time_ns()` followed by 8 random hex
+    digits. Unlike the server's random UUIDs, such IDs are appended at the end of the database's B-tree.
+
+    Returns
+    -------
+    str : The document ID.
+    """
+    return f"{time.time_ns():016x}{secrets.token_hex(4)}"
+
+
 def build_query(
         **kwargs,
 ) -> Optional[str]:
@@ -121,7 +413,18 @@ def build_query(
     -------
     str : A string containing the keyword-args encoded as URL query-params.
     """
-    return parse.urlencode({key: _handler(val) for key, val in kwargs.items() if val is not None})
+    # The values' types are part of the cache key since e.g. `True == 1` but they are encoded differently.
+    items = tuple((key, type(val), val) for key, val in kwargs.items() if val is not None)
+    try:
+        return _encode_query(items)
+    except TypeError:
+        # Unhashable values (e.g. lists of keys) are encoded without caching.
+        return _encode_query.__wrapped__(items)
+
+
+@functools.lru_cache(maxsize=128)
+def _encode_query(items: Tuple[Tuple[str, Type, Any], ...]) -> str:
+    return parse.urlencode([(key, _handler(val)) for key, _, val in items])
 
 
 def build_url(
@@ -160,9 +463,11 @@ def build_url(
     )
 
 
+@functools.lru_cache(maxsize=1024)
 def validate_db_name(name: str) -> bool:
     """
-    Checks a name for CouchDB name-compliance.
+    Checks a name for CouchDB name-compliance. Results are memoized since instances are often created per request
+    for a handful of database names.
 
     Parameters
     ----------
@@ -191,9 +496,25 @@ def validate_auth_method(auth_method: str) -> bool:
     return auth_method in VALID_AUTH_METHODS
 
 
+def validate_transport(transport: str) -> bool:
+    """
+    Checks if the provided transport is valid.
+
+    Parameters
+    ----------
+    transport : str
+
+    Returns
+    -------
+    bool: `True` if `transport` is in `VALID_TRANSPORTS`.
+    """
+    return transport in VALID_TRANSPORTS
+
+
+@functools.lru_cache(maxsize=1024)
 def validate_proxy(proxy: str) -> bool:
     """
-    Check a proxy scheme for CouchDB proxy-scheme-compliance
+    Check a proxy scheme for CouchDB proxy-scheme-compliance. Memoized, as parsing the proxy URL dominates the check.
 
     Parameters
     ----------
@@ -209,7 +530,7 @@ def validate_proxy(proxy: str) -> bool:
 
 def validate_user_id(user_id: str) -> bool:
     """
-    Checks a user ID for CouchDB user-id-compliance.
+    Checks a user ID for CouchDB user-id-compliance, i.e. whether it matches `PATTERN_USER_ID`.
 
     Parameters
     ----------
@@ -221,7 +542,8 @@ def validate_user_id(user_id: str) -> bool:
     bool : `True` if the provided user ID is CouchDB compliant.
 
     """
-    return bool(PATTERN_USER_ID.fullmatch(user_id))
+    # Equivalent to `PATTERN_USER_ID.fullmatch(user_id)`, whose `.*` does not match line breaks.
+    return user_id.startswith(USER_ID_PREFIX) and "\n" not in user_id
 
 
 def user_name_to_id(name: str) -> str:
@@ -237,7 +559,7 @@ def user_name_to_id(name: str) -> str:
     -------
     str : A valid CouchDB ID, i.e. of the form `org.couchdb.user:{name}`.
     """
-    return f"org.couchdb.user:{name}"
+    return f"{USER_ID_PREFIX}{name}"
 
 
 def check_response(response: requests.Response) -> None:
@@ -247,7 +569,7 @@ def check_response(response: requests.Response) -> None:
     Parameters
     ----------
     response : requests.Response
-        A `requests.Response` object.
+        A `requests.Response` (or `httpx.Response`) object.
     Returns
     -------
     None
@@ -256,27 +578,17 @@ def check_response(response: requests.Response) -> None:
     One of the following exceptions:
 
     - couchdb3.error.CouchDBError
-    - ConnectionError
-    - TimeoutError
-    - requests.exceptions.ConnectionError
     - requests.exceptions.HTTPError
+    - httpx.HTTPStatusError
 
     """
-    try:
-        response.raise_for_status()
-    except (
-            ConnectionError,
-            TimeoutError,
-            requests.exceptions.ConnectionError,
-            requests.exceptions.HTTPError,
-    ) as err:
-        if response.status_code in exceptions.STATUS_CODE_ERROR_MAPPING:
-            _ = exceptions.STATUS_CODE_ERROR_MAPPING[response.status_code]
-            if _:
-                raise _(response.text)
-            else:
-                return None
-        raise err
+    if response.status_code < 400:
+        return None
+    _ = exceptions.error_for_status(response.status_code)
+    if _:
+        raise _(response.text)
+    # Unmapped error codes are raised by the response itself - which keeps this check independent of the transport.
+    response.raise_for_status()
 
 
 def extract_url_data(url: str) -> Dict:
@@ -299,13 +611,14 @@ def extract_url_data(url: str) -> Dict:
       - port
       - path
     """
-    if not any(url.startswith(_) for _ in VALID_SCHEMES):
+    if not url.startswith(_VALID_SCHEME_PREFIXES):
         url = f"http://{url}"
     parsed = parse_url(url)
+    user, sep, password = (parsed.auth or "").partition(":")
     return {
         "scheme": parsed.scheme,
-        "user": parsed.auth.split(":")[0] if hasattr(parsed.auth, "split") else None,
-        "password": parsed.auth.split(":")[1] if hasattr(parsed.auth, "split") else None,
+        "user": user or None,
+        "password": password if sep else None,
         "host": parsed.host,
         "port": parsed.port,
         "path": parsed.path
@@ -5,12 +5,15 @@ from typing import Optional, Union, Dict, Any, List
 
 from .base import DictBase
 from .document import Document
+from .utils import json_loads
 
 
 class ViewRow(DictBase):
     """
     View row object.
     """
+    __slots__ = ("_doc", "_id", "_key", "_value")
+
     def __init__(self, *args, **kwargs) -> None:
         super(ViewRow, self).__init__(*args, **kwargs)
         self.doc = self.get("doc", None)
@@ -23,13 +26,17 @@ class ViewRow(DictBase):
         """
         Returns
         -------
-        Optional[Document] : The row's document.
+        Optional[Document] : The row's document - wrapped on first access, so rows whose documents are never read
+        skip copying them.
         """
-        return self._doc
+        doc = self._doc
+        if doc is not None and not isinstance(doc, Document):
+            doc = self._doc = Document.from_dict(doc)
+        return doc
 
     @doc.setter
     def doc(self, value: Union[Dict, Document]) -> None:
-        self._doc = Document(**value) if value else None
+        self._doc = value or None
 
     @property
     def id(self) -> str:
@@ -75,6 +82,25 @@ class ViewResult(DictBase):
     """
     View result object.
     """
+    __slots__ = ("_offset", "_rows", "_total_rows")
+
+    @classmethod
+    def from_bytes(cls, data: Union[bytes, str]) -> "ViewResult":
+        """
+        Build a view result from a serialized response body, c.f. `couchdb3.utils.json_loads`. The deserialized
+        dictionary is passed positionally, i.e. without unpacking it into keyword parameters first.
+
+        Parameters
+        ----------
+        data : Union[bytes, str]
+            The response's body.
+
+        Returns
+        -------
+        ViewResult
+        """
+        return cls(json_loads(data))
+
     def __init__(self, *args, **kwargs) -> None:
         super(ViewResult, self).__init__(*args, **kwargs)
         self.offset = self.get("offset", 0)
@@ -105,7 +131,7 @@ class ViewResult(DictBase):
 
     @rows.setter
     def rows(self, value: List[ViewRow]) -> None:
-        self._rows = [ViewRow(**_) for _ in value]
+        self._rows = [ViewRow(_) for _ in value]
 
     @property
     def total_rows(self) -> int:
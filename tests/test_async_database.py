@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import atexit
+
+import unittest
+
+from couchdb3.async_database import AsyncDatabase, AsyncPartition
+from couchdb3.document import AttachmentDocument, Document
+from couchdb3.exceptions import NotFoundError
+from couchdb3.server import Server
+from couchdb3.view import ViewResult
+
+from tests.credentials import ATTACHMENT_PATH_TXT, COUCHDB_USER, COUCHDB_PASSWORD, COUCHDB0_URL, DOCUMENT_VIEW
+
+
+CLIENT: Server = Server(COUCHDB0_URL, user=COUCHDB_USER, password=COUCHDB_PASSWORD)
+DB_NAME: str = "tmp-test-async-db"
+DB_NAME_PARTITIONED: str = f"{DB_NAME}-partitioned"
+for _ in (DB_NAME, DB_NAME_PARTITIONED):
+    if _ not in CLIENT:
+        CLIENT.create(_, partitioned=_ == DB_NAME_PARTITIONED)
+
+
+class TestAsyncDatabase(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.db = AsyncDatabase(
+            DB_NAME,
+            url=COUCHDB0_URL,
+            user=COUCHDB_USER,
+            password=COUCHDB_PASSWORD,
+            monotonic_ids=True,
+            default_view_update="lazy",
+        )
+        await self.db.__aenter__()
+
+    async def asyncTearDown(self) -> None:
+        await self.db.__aexit__(None, None, None)
+
+    async def test_bulk_get(self):
+        docids = [f"test-async-bulk-get-{_}" for _ in range(3)]
+        await self.db.bulk_docs([{"_id": _} for _ in docids])
+        results = await self.db.bulk_get([{"_id": _} for _ in docids])
+        self.assertListEqual(docids, [_["id"] for _ in results])
+
+    async def test_copy(self):
+        await self.db.save({"_id": "test-async-copy-src", "name": "Hello"})
+        _id, ok, _rev = await self.db.copy("test-async-copy-src", "test-async-copy-dest")
+        self.assertEqual("test-async-copy-dest", _id)
+        self.assertTrue(ok)
+        self.assertEqual("Hello", (await self.db.get(_id))["name"])
+
+    async def test_create(self):
+        ids = [(await self.db.create({"name": "Hello"}))[0] for _ in range(3)]
+        # `monotonic_ids` assigns sorted IDs.
+        self.assertListEqual(sorted(ids), ids)
+        self.assertEqual(len(ids), len(set(ids)))
+
+    async def test_delete(self):
+        _id, _, _rev = await self.db.save({"_id": "test-async-delete"})
+        self.assertTrue(await self.db.delete(_id, rev=_rev))
+        self.assertFalse(await self.db.contains(_id))
+
+    async def test_find(self):
+        await self.db.bulk_docs([{"_id": f"test-async-find-{_}", "find": _} for _ in range(3)])
+        result = await self.db.find({"find": 1})
+        self.assertListEqual(["test-async-find-1"], [_["_id"] for _ in result["docs"]])
+
+    async def test_get(self):
+        await self.db.save({"_id": "test-async-get", "name": "Hello"})
+        doc = await self.db.get("test-async-get", rev=await self.db.rev("test-async-get"))
+        self.assertIsInstance(doc, Document)
+        self.assertEqual("Hello", doc["name"])
+        self.assertIsNone(await self.db.get("test-async-get-missing"))
+        with self.assertRaises(NotFoundError):
+            await self.db.get("test-async-get-missing", check=True)
+
+    async def test_put_attachment(self):
+        docid = "test-async-put-attachment"
+        await self.db.save({"_id": docid})
+        _id, ok, _rev = await self.db.put_attachment(
+            docid, "test.txt", ATTACHMENT_PATH_TXT, rev=await self.db.rev(docid)
+        )
+        self.assertTrue(ok)
+        attachment = await self.db.get_attachment(docid, "test.txt")
+        self.assertIsInstance(attachment, AttachmentDocument)
+        with open(ATTACHMENT_PATH_TXT, "rb") as _:
+            self.assertEqual(_.read(), attachment.content)
+        self.assertTrue(await self.db.delete_attachment(docid, "test.txt", rev=_rev))
+
+    async def test_view(self):
+        await self.db.put_design(
+            "async-document-design",
+            rev=await self.db.rev("_design/async-document-design"),
+            views={"document-view": {"map": DOCUMENT_VIEW}},
+        )
+        await self.db.bulk_docs([{"_id": f"test-async-view-{_}", "type": "document"} for _ in range(3)])
+        result = await self.db.view("async-document-design", "document-view", keys=["test-async-view-1"])
+        self.assertIsInstance(result, ViewResult)
+        self.assertListEqual(["test-async-view-1"], [_.id for _ in result.rows])
+
+    async def test_partition(self):
+        async with AsyncDatabase(
+            DB_NAME_PARTITIONED,
+            url=COUCHDB0_URL,
+            user=COUCHDB_USER,
+            password=COUCHDB_PASSWORD,
+            monotonic_ids=True,
+        ) as db:
+            partition = db.get_partition("p0")
+            self.assertIsInstance(partition, AsyncPartition)
+            self.assertIs(partition, db.get_partition("p0"))
+            _id, ok, _rev = await partition.save({"_id": "test-async-partition"})
+            self.assertEqual("p0:test-async-partition", _id)
+            self.assertEqual(_id, (await partition.get("test-async-partition"))["_id"])
+            self.assertTrue((await partition.create({"name": "Hello"}))[0].startswith("p0:"))
+            await partition.close()
+            # Closing the partition leaves the database's session open.
+            self.assertTrue(await db.contains(_id))
+
+
+@atexit.register
+def rm_test_db() -> None:
+    """
+    Removing temporary test databases.
+    """
+    for db_name in (DB_NAME, DB_NAME_PARTITIONED):
+        if db_name in CLIENT:
+            CLIENT.delete(db_name)
+
+
+if __name__ == '__main__':
+    unittest.main()
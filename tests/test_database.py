@@ -6,6 +6,7 @@ import datetime
 import mimetypes
 import random
 import string
+import time
 
 import unittest
 
@@ -87,6 +88,23 @@ class TestDatabase(unittest.TestCase):
             for _ in res["docs"]:
                 self.assertIsInstance(_["ok"], dict)
 
+    def test_batched(self):
+        docids = [f"test-batched-doc-{_}" for _ in range(5)]
+        with DB.batched(window=0) as batch:
+            misses = [batch.get(_) for _ in docids]
+            writes = [batch.create({"_id": _, "index": i}) for i, _ in enumerate(docids)]
+            reads = [batch.get(_) for _ in docids]
+        # The operations are sent in the order they were queued.
+        self.assertListEqual([None] * len(docids), [_.result() for _ in misses])
+        self.assertListEqual(docids, [_.result()[0] for _ in writes])
+        self.assertListEqual(list(range(len(docids))), [_.result()["index"] for _ in reads])
+        with DB.batched(window=0) as batch:
+            deletes = [batch.delete(_, w.result()[2]) for _, w in zip(docids, writes)]
+            reads = [batch.get(_) for _ in docids]
+        self.assertTrue(all(_.result() for _ in deletes))
+        self.assertListEqual([None] * len(docids), [_.result() for _ in reads])
+        self.assertFalse(any(_ in DB for _ in docids))
+
     def test_compact(self):
         DB.compact()
         self.assertTrue(DB.info().get("compact_running"))
@@ -129,6 +147,28 @@ class TestDatabase(unittest.TestCase):
         )
         self.assertEqual(result, True)
 
+    def test_enable_change_invalidation(self):
+        docid = "test-change-invalidation-doc"
+        DB.save({"_id": docid, "value": 0})
+        DB.enable_change_invalidation(poll_timeout=1)
+        try:
+            self.assertEqual(0, DB.get(docid)["value"])
+            doc = DB.get(docid)
+            doc["value"] = 1
+            DB.save(doc)
+            self.assertEqual(1, DB.get(docid)["value"])
+            # Writes of other clients are noticed via the change feed.
+            other = CLIENT.get(DB_NAME)
+            doc = other.get(docid)
+            doc["value"] = 2
+            other.save(doc)
+            deadline = time.time() + 10
+            while DB.get(docid)["value"] != 2 and time.time() < deadline:
+                time.sleep(.1)
+            self.assertEqual(2, DB.get(docid)["value"])
+        finally:
+            DB.disable_change_invalidation()
+
     def test_explain(self):
         DB.save_index(
             index={
@@ -209,6 +249,63 @@ class TestDatabase(unittest.TestCase):
             int((now + datetime.timedelta(days=2)).timestamp())
         )
 
+    def test_iter_all_docs(self):
+        docs = [{"_id": f"test-iter-all-docs-doc-{_}"} for _ in range(7)]
+        DB.bulk_docs(docs=docs)
+        rows = list(DB.iter_all_docs(
+            page_size=3,
+            startkey="\"test-iter-all-docs-doc-\"",
+            endkey="\"test-iter-all-docs-doc-~\"",
+        ))
+        self.assertListEqual([_["_id"] for _ in docs], [_.id for _ in rows])
+
+    def test_iter_view(self):
+        ddoc = "iter-view-design"
+        _id = f"_design/{ddoc}"
+        if _id not in DB:
+            DB.put_design(
+                ddoc=ddoc,
+                views={
+                    "by-group": {
+                        "map": "function (doc) { if (doc.type === \"iter-view\") { emit(doc.group, null); } }"
+                    }
+                },
+            )
+        # Pages end in the middle of runs of rows sharing the same key.
+        docs = [{"_id": f"test-iter-view-doc-{_}", "type": "iter-view", "group": _ // 3} for _ in range(7)]
+        DB.bulk_docs(docs=docs)
+        rows = list(DB.iter_view(ddoc=ddoc, view="by-group", page_size=2))
+        self.assertListEqual([_["_id"] for _ in docs], [_.id for _ in rows])
+        self.assertListEqual([_["group"] for _ in docs], [_.key for _ in rows])
+        self.assertListEqual(
+            [_.id for _ in rows],
+            [_.id for _ in DB.iter_view(ddoc=ddoc, view="by-group")]
+        )
+        with self.assertRaises(ValueError):
+            DB.iter_view(ddoc=ddoc, view="by-group", page_size=2, keys=[0])
+
+    def test_head_cache(self):
+        name = f"{DB_NAME}-head-cache"
+        db = CLIENT.create(name)
+        db.head_cache_ttl = .5
+        docid = "test-head-cache-doc"
+        self.assertFalse(docid in db)
+        # Documents saved via other instances go unnoticed until the outcome expires, also across read-only `POST`
+        # requests.
+        CLIENT.get(name).save({"_id": docid})
+        db.find(selector={"_id": docid})
+        self.assertFalse(docid in db)
+        time.sleep(db.head_cache_ttl)
+        self.assertTrue(docid in db)
+        # Mutating requests sent by the instance itself clear the cache.
+        db.delete(docid, db.rev(docid))
+        self.assertFalse(docid in db)
+        self.assertTrue(db)
+        CLIENT.delete(name)
+        self.assertTrue(db)
+        time.sleep(db.head_cache_ttl)
+        self.assertFalse(db)
+
     def test_indexes(self):
         result = DB.indexes()
         self.assertIsInstance(result["total_rows"], int)
@@ -345,6 +442,29 @@ class TestDatabase(unittest.TestCase):
             result = DB.get_design(ddoc=DDOC_ID)
             self.assertIsInstance(result, Document)
 
+    def test_promote_design(self):
+        ddoc = "promote-design"
+        views = {
+            "by-name": {
+                "map": "function (doc) { emit(doc.name, null); }"
+            }
+        }
+        DB.put_design(ddoc=ddoc, rev=DB.rev(f"_design/{ddoc}"), views=views)
+        views = {
+            "by-name": {
+                "map": "function (doc) { emit(doc.name, 1); }"
+            }
+        }
+        DB.put_design(ddoc=f"{ddoc}-next", rev=DB.rev(f"_design/{ddoc}-next"), views=views)
+        rev = DB.rev(f"_design/{ddoc}")
+        # Replacing an existing design requires sending its revision (`destrev`), the server answering with a conflict
+        # otherwise.
+        _id, ok, _rev = DB.promote_design(f"{ddoc}-next", ddoc)
+        self.assertTrue(ok)
+        self.assertEqual(f"_design/{ddoc}", _id)
+        self.assertNotEqual(rev, _rev)
+        self.assertEqual(views, DB.get_design(ddoc)["views"])
+
     def test_put_attachment(self):
         docid = "test-doc-put-attachment"
         DB.save({"_id": docid})
@@ -365,6 +485,14 @@ class TestDatabase(unittest.TestCase):
             self.assertEqual(results[1], True)
             self.assertEqual(results[2], DB.rev(docid))
 
+    def test_rev_many(self):
+        docids = [f"test-rev-many-doc-{_}" for _ in range(3)]
+        results = DB.bulk_docs(docs=[{"_id": _} for _ in docids])
+        self.assertListEqual(
+            [_["rev"] for _ in results] + [None],
+            DB.rev_many(docids + ["test-rev-many-doc-missing"])
+        )
+
     def test_save(self):
         doc0 = {
             "type": "test-doc-save",
@@ -456,6 +584,18 @@ class TestDatabase(unittest.TestCase):
             )
             self.assertEqual(result.rows[0].id, docid)
 
+    def test_metadata_snapshot(self):
+        ddoc = "metadata-snapshot-design"
+        if f"_design/{ddoc}" not in DB:
+            DB.put_design(ddoc=ddoc, views={VIEW_ID: {"map": DOCUMENT_VIEW}})
+        snapshot = DB.metadata_snapshot(ddocs=[ddoc, f"{ddoc}-missing"])
+        self.assertEqual(DB.name, snapshot["info"]["db_name"])
+        self.assertIsInstance(snapshot["indexes"]["indexes"], list)
+        self.assertListEqual([ddoc, f"{ddoc}-missing"], list(snapshot["designs"]))
+        self.assertIsInstance(snapshot["designs"][ddoc], Document)
+        self.assertEqual(f"_design/{ddoc}", snapshot["designs"][ddoc]["_id"])
+        self.assertIsNone(snapshot["designs"][f"{ddoc}-missing"])
+
     def test_partition(self):
         self.assertTrue(DB_PARTITIONED.info()["props"]["partitioned"])
         partition = DB_PARTITIONED.get_partition("p0")
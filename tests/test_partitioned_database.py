@@ -17,6 +17,14 @@ DB: Database = CLIENT.get(DB_NAME) if DB_NAME in CLIENT else CLIENT.create(DB_NA
 
 
 class TestPartitionedDatabase(unittest.TestCase):
+    def test_batched(self):
+        partition = DB.get_partition("partition-batched")
+        with partition.batched(window=0) as batch:
+            write = batch.create({"_id": "test-doc-id", "name": "Hello"})
+            read = batch.get("test-doc-id")
+        self.assertEqual("partition-batched:test-doc-id", write.result()[0])
+        self.assertEqual("partition-batched:test-doc-id", read.result()["_id"])
+
     def test_create(self):
         for i in range(2):
             docid = f"partition-{i}:test-doc-id"
@@ -31,6 +39,16 @@ class TestPartitionedDatabase(unittest.TestCase):
             self.assertIsInstance(_rev, str)
             self.assertEqual(_id, docid)
 
+    def test_partition_context_manager(self):
+        with DB.get_partition("partition-0") as partition:
+            self.assertEqual(partition.get("test-doc-id")["_id"], "partition-0:test-doc-id")
+        # Leaving the partition's block must neither shut down the database's thread pool nor close its session.
+        revs = DB.rev_many(["partition-0:test-doc-id", "partition-1:test-doc-id"])
+        self.assertEqual(2, len(revs))
+        for _ in revs:
+            self.assertIsInstance(_, str)
+        self.assertTrue(DB.check())
+
     def test_put_design(self):
         for ddoc, partitioned in [
             ("document-design-unpartitioned", False),
@@ -52,6 +70,24 @@ class TestPartitionedDatabase(unittest.TestCase):
             self.assertEqual(ok, True)
             self.assertIsInstance(_rev, str)
 
+    def test_put_design_partitioned(self):
+        ddoc = "document-design-partitioned-flag"
+        _id, ok, _rev = DB.put_design(
+            ddoc=ddoc,
+            rev=DB.rev(f"_design/{ddoc}"),
+            views={
+                "document-view": {
+                    "map": DOCUMENT_VIEW
+                }
+            },
+            options={
+                "include_design": False
+            },
+            partitioned=True
+        )
+        self.assertEqual(ok, True)
+        self.assertEqual(DB.get(_id)["options"], {"include_design": False, "partitioned": True})
+
 
 @atexit.register
 def rm_test_db() -> None:
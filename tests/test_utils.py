@@ -1,10 +1,12 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import gzip
+import pickle
 import unittest
 from urllib import parse
 
-from couchdb3 import utils
+from couchdb3 import document, exceptions, utils, view
 
 
 class TestUtils(unittest.TestCase):
@@ -21,6 +23,24 @@ class TestUtils(unittest.TestCase):
         ).url
         self.assertEqual(url0, parse.unquote(url1))
 
+    def test_build_query(self):
+        self.assertEqual("descending=true&skip=1", utils.build_query(descending=True, skip=1, limit=None))
+        self.assertEqual("descending=1&skip=1", utils.build_query(descending=1, skip=1, limit=None))
+        self.assertEqual(
+            "keys=[\"hello\",\"world\"]",
+            parse.unquote(utils.build_query(keys=["hello", "world"]))
+        )
+        self.assertEqual(
+            "keys=[1,\"a\\\"b\"]&start_key={\"a\":[true,null]}",
+            parse.unquote(utils.build_query(keys=(1, "a\"b"), start_key={"a": [True, None]}))
+        )
+
+    def test_error_for_status(self):
+        for status, error in exceptions.STATUS_CODE_ERROR_MAPPING.items():
+            self.assertIs(error, exceptions.error_for_status(status))
+        self.assertIsNone(exceptions.error_for_status(418))
+        self.assertIsNone(exceptions.error_for_status(600))
+
     def test_extract_url_data(self):
         scheme = "http"
         user = "user"
@@ -36,6 +56,79 @@ class TestUtils(unittest.TestCase):
         self.assertEqual(host, data["host"])
         self.assertEqual(port, data["port"])
         self.assertEqual(path, data["path"].lstrip("/"))
+        data = utils.extract_url_data(f"{user}@{host}")
+        self.assertEqual(user, data["user"])
+        self.assertIsNone(data["password"])
+        self.assertEqual("pass:word", utils.extract_url_data(f"{user}:pass:word@{host}")["password"])
+
+    def test_iter_gzip(self):
+        chunks = [b"{\"docs\":[", b"{\"_id\":\"doc\"}" * 1000, b"]}"]
+        self.assertEqual(b"".join(chunks), gzip.decompress(b"".join(utils.iter_gzip(chunks))))
+        self.assertEqual(b"", gzip.decompress(b"".join(utils.iter_gzip([]))))
+
+    def test_iter_json_docs(self):
+        docs = [{"_id": f"doc-{i}", "value": i} for i in range(100)]
+        chunks = list(utils.iter_json_docs(docs, chunk_size=256, new_edits=False))
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual({"new_edits": False, "docs": docs}, utils.json_loads(b"".join(chunks)))
+        self.assertEqual({"docs": []}, utils.json_loads(b"".join(utils.iter_json_docs([]))))
+
+    def test_monotonic_id(self):
+        ids = [utils.monotonic_id() for _ in range(100)]
+        self.assertTrue(all(len(_) == 24 and utils.validate_db_name(f"a{_}") for _ in ids))
+        self.assertEqual(len(ids), len(set(ids)))
+        self.assertEqual(sorted(_[:16] for _ in ids), [_[:16] for _ in ids])
+
+    def test_iter_view_rows(self):
+        rows = [{"id": f"doc-{i}", "key": [i, "ä"], "value": {"rev": "1-abc"}} for i in range(3)]
+        body = b"{\"total_rows\":3,\"offset\":0,\"rows\":[\r\n" + b",\r\n".join(
+            utils.json_dumps(_) for _ in rows
+        ) + b"\r\n],\r\n\"update_seq\":\"3-abc\"}\n"
+        self.assertEqual(rows, list(utils.iter_view_rows(body[i:i + 7] for i in range(0, len(body), 7))))
+        self.assertEqual([], list(utils.iter_view_rows([b"{\"total_rows\":0,\"offset\":0,\"rows\":[\r\n\r\n]}\n"])))
+
+    def test_json_roundtrip(self):
+        obj = {"_id": "some-doc", "list": [1, 2.5, None, True], "nested": {"key": "välue"}}
+        data = utils.json_dumps(obj)
+        self.assertIsInstance(data, bytes)
+        self.assertNotIn(b" ", data)
+        self.assertIn("välue".encode(), data)
+        self.assertEqual(obj, utils.json_loads(data))
+        self.assertEqual(obj, utils.json_loads(data.decode()))
+
+    def test_pickle_view(self):
+        result = view.ViewResult.from_bytes(
+            b"{\"total_rows\":2,\"offset\":1,\"rows\":[{\"id\":\"a\",\"key\":[1,\"a\"],\"value\":null,"
+            b"\"doc\":{\"_id\":\"a\",\"_rev\":\"1-abc\"}}]}"
+        )
+        # The slots' values are pickled as the instances' state, apart from their dictionary items.
+        for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+            copy = pickle.loads(pickle.dumps(result, protocol=protocol))
+            self.assertIsInstance(copy, view.ViewResult)
+            self.assertEqual(result, copy)
+            self.assertEqual((2, 1), (copy.total_rows, copy.offset))
+            row = copy.rows[0]
+            self.assertIsInstance(row, view.ViewRow)
+            self.assertEqual(("a", [1, "a"], None), (row.id, row.key, row.value))
+            self.assertIsInstance(row.doc, document.Document)
+            self.assertEqual("1-abc", row.doc["_rev"])
+            row = pickle.loads(pickle.dumps(result.rows[0], protocol=protocol))
+            self.assertEqual(("a", [1, "a"]), (row.id, row.key))
+
+    def test_security_document_element(self):
+        names = ["bob", "alice"]
+        element = document.SecurityDocumentElement()
+        element.names = names
+        element.add_name("alice")
+        element.add_name("carol")
+        self.assertEqual(["alice", "bob", "carol"], element.names)
+        self.assertEqual(["bob", "alice"], names)
+        roles = ["b", "a", "b"]
+        element.roles = roles
+        element.add_role("c")
+        element.add_role("a")
+        self.assertEqual(["a", "b", "c"], element.roles)
+        self.assertEqual(["b", "a", "b"], roles)
 
 
 if __name__ == '__main__':